@@ -2,6 +2,6 @@
 Configuration module for Sonicarbi flashloan arbitrage bot.
 """
 
-from .config import config
+from .config import config, get_config, Config
 
-__all__ = ['config']
+__all__ = ['config', 'get_config', 'Config']
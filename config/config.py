@@ -1,84 +1,296 @@
+import json
 import os
+import re
 import shutil
+from dataclasses import make_dataclass
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Optional
 
 # Load .env from config directory relative to this file
 config_dir = Path(__file__).parent
 env_path = config_dir / '.env'
 env_example_path = config_dir / '.env.example'
+env_cache_path = config_dir / '.env.cache.json'
+env_snapshot_path = config_dir / '.env.validated.json'
 
-# Auto-create .env from .env.example if it doesn't exist
-if not env_path.exists() and env_example_path.exists():
-    print(f"[INFO] .env file not found. Creating from .env.example...")
-    shutil.copy(env_example_path, env_path)
-    print(f"[INFO] Created {env_path}")
+# KEY=value lines, with an optional leading "export"
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*\r?$',
+    re.MULTILINE
+)
+
+
+def _ensure_env_file() -> os.stat_result:
+    """
+    Make sure .env exists, seeding it from .env.example on first run.
+
+    Returns:
+        stat result of .env (one stat() syscall on the common path)
+    """
+    try:
+        return os.stat(env_path)
+    except FileNotFoundError:
+        pass
+
+    # Auto-create .env from .env.example. copyfile uses the platform's
+    # zero-copy primitive (sendfile/fcopyfile) where available.
+    try:
+        shutil.copyfile(env_example_path, env_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Neither .env nor .env.example found in {config_dir}. "
+            f"Please create a .env file with your configuration."
+        ) from None
+
+    print(f"[INFO] .env file not found. Created {env_path} from .env.example")
     print(f"[INFO] Please edit {env_path} and configure your settings (especially PRIVATE_KEY if trading)")
-elif not env_path.exists() and not env_example_path.exists():
-    raise FileNotFoundError(
-        f"Neither .env nor .env.example found in {config_dir}. "
-        f"Please create a .env file with your configuration."
-    )
+    return os.stat(env_path)
 
-load_dotenv(env_path)
 
-class Config:
-    # Network
-    SCROLL_RPC_URL = os.getenv('SCROLL_RPC_URL')
-    SCROLL_TESTNET_RPC = os.getenv('SCROLL_TESTNET_RPC')
-    CHAIN_ID = int(os.getenv('SCROLL_CHAIN_ID', 534352))
-    NETWORK_MODE = os.getenv('NETWORK_MODE', 'testnet')
+def _parse_env_text(text: str) -> dict:
+    """
+    Parse .env content into a dict.
 
-    # Get active RPC based on mode
-    ACTIVE_RPC = SCROLL_TESTNET_RPC if NETWORK_MODE == 'testnet' else SCROLL_RPC_URL
-    ACTIVE_CHAIN_ID = 534351 if NETWORK_MODE == 'testnet' else CHAIN_ID
+    Supports the subset of dotenv syntax this project uses: KEY=value lines,
+    full-line and trailing " #" comments, and single/double-quoted values.
+    """
+    values = {}
+    for key, value in _ENV_LINE_RE.findall(text):
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        else:
+            value = value.split(' #', 1)[0].rstrip()
+        values[key] = value
+    return values
+
+
+def _env_cache_key(env_stat: os.stat_result) -> list:
+    return [env_stat.st_mtime_ns, env_stat.st_size]
+
+
+def _write_private_json(path: Path, data: dict) -> None:
+    """
+    Write JSON readable by the owner only.
+
+    The .env caches hold every secret in .env (PRIVATE_KEY, bot tokens,
+    DATABASE_URL), so they get 0600 like a private key file. fchmod also
+    tightens a file left behind with looser permissions.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, 'w') as f:
+        os.fchmod(fd, 0o600)
+        json.dump(data, f)
+
+
+def _read_env_file(env_stat: os.stat_result) -> dict:
+    """
+    Return the parsed key/value pairs of .env.
+
+    The parse result is cached next to .env and keyed on its mtime and size,
+    so warm starts skip the dotenv parser entirely and only read a small
+    JSON file.
+    """
+    cache_key = _env_cache_key(env_stat)
+
+    try:
+        with open(env_cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('key') == cache_key:
+            return cached['values']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    values = _parse_env_text(env_path.read_text(encoding='utf-8'))
+
+    try:
+        _write_private_json(env_cache_path, {'key': cache_key, 'values': values})
+    except OSError:
+        pass  # Read-only config dir; just parse again next time
+
+    return values
+
+
+def _load_env(env_stat: os.stat_result) -> None:
+    """Load .env into os.environ without overriding variables already set."""
+    for key, value in _read_env_file(env_stat).items():
+        os.environ.setdefault(key, value)
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# Single source of truth for every setting:
+#   field name -> (environment variable, parser, default)
+# A default of None means "unset"; the parser is only applied to real values.
+SCHEMA = {
+    # Network
+    'SCROLL_RPC_URL': ('SCROLL_RPC_URL', str, None),
+    'SCROLL_TESTNET_RPC': ('SCROLL_TESTNET_RPC', str, None),
+    'SCROLL_WS_URL': ('SCROLL_WS_URL', str, None),  # Optional; drives scans per new block
+    'SCROLL_TESTNET_WS': ('SCROLL_TESTNET_WS', str, None),
+    'LOCAL_IPC_PATH': ('LOCAL_IPC_PATH', str, None),  # Local node IPC socket; overrides the HTTP RPC for the scanner
+    'CHAIN_ID': ('SCROLL_CHAIN_ID', int, 534352),
+    'NETWORK_MODE': ('NETWORK_MODE', str, 'testnet'),
+    'MAX_INFLIGHT_RPC': ('MAX_INFLIGHT_RPC', int, 16),  # Concurrent scanner RPC calls
 
     # Keys
-    PRIVATE_KEY = os.getenv('PRIVATE_KEY')
+    'PRIVATE_KEY': ('PRIVATE_KEY', str, None),
 
     # Contracts
-    FLASHLOAN_CONTRACT = os.getenv('FLASHLOAN_CONTRACT')
-    AAVE_V3_POOL = os.getenv('AAVE_V3_POOL')
+    'FLASHLOAN_CONTRACT': ('FLASHLOAN_CONTRACT', str, None),
+    'AAVE_V3_POOL': ('AAVE_V3_POOL', str, None),
 
     # Database
-    DATABASE_URL = os.getenv('DATABASE_URL')
+    'DATABASE_URL': ('DATABASE_URL', str, None),
 
     # Trading
-    PROFIT_THRESHOLD = float(os.getenv('PROFIT_THRESHOLD', 0.005))
-    MAX_GAS_PRICE = float(os.getenv('MAX_GAS_PRICE', 0.1))
-    MIN_LIQUIDITY_USD = float(os.getenv('MIN_LIQUIDITY_USD', 5000))
-    SLIPPAGE_TOLERANCE = float(os.getenv('SLIPPAGE_TOLERANCE', 0.02))
-
-    # Minimum profit in USD to execute trade (dust threshold)
-    MIN_PROFIT_USD = float(os.getenv('MIN_PROFIT_USD', 1.0))
-
-    # Maximum trade size in USD (safety limit)
-    MAX_TRADE_SIZE_USD = float(os.getenv('MAX_TRADE_SIZE_USD', 10000.0))
+    'PROFIT_THRESHOLD': ('PROFIT_THRESHOLD', float, 0.005),
+    'MAX_GAS_PRICE': ('MAX_GAS_PRICE', float, 0.1),
+    'MIN_LIQUIDITY_USD': ('MIN_LIQUIDITY_USD', float, 5000.0),
+    'SLIPPAGE_TOLERANCE': ('SLIPPAGE_TOLERANCE', float, 0.02),
+    'MIN_PROFIT_USD': ('MIN_PROFIT_USD', float, 1.0),  # Dust threshold
+    'MAX_TRADE_SIZE_USD': ('MAX_TRADE_SIZE_USD', float, 10000.0),  # Safety limit
+    'EVAL_CONCURRENCY': ('EVAL_CONCURRENCY', int, 8),  # Parallel opportunity evaluations
 
     # Monitoring
-    ENABLE_TELEGRAM = os.getenv('ENABLE_TELEGRAM_ALERTS', 'false').lower() == 'true'
-    TELEGRAM_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-    TELEGRAM_CHAT = os.getenv('TELEGRAM_CHAT_ID')
-    DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
+    'ENABLE_TELEGRAM': ('ENABLE_TELEGRAM_ALERTS', _parse_bool, False),
+    'TELEGRAM_TOKEN': ('TELEGRAM_BOT_TOKEN', str, None),
+    'TELEGRAM_CHAT': ('TELEGRAM_CHAT_ID', str, None),
+    'DISCORD_WEBHOOK_URL': ('DISCORD_WEBHOOK_URL', str, None),
 
     # Chainlink Price Feeds (Scroll Mainnet)
-    CHAINLINK_ETH_USD = os.getenv('CHAINLINK_ETH_USD', '0x6bF14CB0A831078629D993FDeBcB182b21A8774C')
+    'CHAINLINK_ETH_USD': ('CHAINLINK_ETH_USD', str, '0x6bF14CB0A831078629D993FDeBcB182b21A8774C'),
 
     # Price validation bounds
-    MIN_ETH_PRICE_USD = float(os.getenv('MIN_ETH_PRICE_USD', 100.0))
-    MAX_ETH_PRICE_USD = float(os.getenv('MAX_ETH_PRICE_USD', 20000.0))
-    MAX_PRICE_AGE_SECONDS = int(os.getenv('MAX_PRICE_AGE_SECONDS', 600))  # 10 minutes
+    'MIN_ETH_PRICE_USD': ('MIN_ETH_PRICE_USD', float, 100.0),
+    'MAX_ETH_PRICE_USD': ('MAX_ETH_PRICE_USD', float, 20000.0),
+    'MAX_PRICE_AGE_SECONDS': ('MAX_PRICE_AGE_SECONDS', int, 600),  # 10 minutes
 
     # Debug
-    DEBUG_MODE = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    'DEBUG_MODE': ('DEBUG_MODE', _parse_bool, False),
 
     # Multi-Hop Routing
-    ENABLE_MULTI_HOP_ROUTING = os.getenv('ENABLE_MULTI_HOP_ROUTING', 'true').lower() == 'true'
-    MAX_ROUTING_HOPS = int(os.getenv('MAX_ROUTING_HOPS', 2))
+    'ENABLE_MULTI_HOP_ROUTING': ('ENABLE_MULTI_HOP_ROUTING', _parse_bool, True),
+    'MAX_ROUTING_HOPS': ('MAX_ROUTING_HOPS', int, 2),
 
     # Private Mempool (MEV Protection)
-    USE_PRIVATE_MEMPOOL = os.getenv('USE_PRIVATE_MEMPOOL', 'false').lower() == 'true'
-    FLASHBOTS_RPC_URL = os.getenv('FLASHBOTS_RPC_URL')  # e.g., https://relay.flashbots.net (if available)
-    PRIVATE_RPC_URL = os.getenv('PRIVATE_RPC_URL')  # Private RPC with direct builder access
+    'USE_PRIVATE_MEMPOOL': ('USE_PRIVATE_MEMPOOL', _parse_bool, False),
+    'FLASHBOTS_RPC_URL': ('FLASHBOTS_RPC_URL', str, None),  # e.g., https://relay.flashbots.net
+    'PRIVATE_RPC_URL': ('PRIVATE_RPC_URL', str, None),  # Private RPC with direct builder access
+}
+
+# Fields computed from other settings rather than read from the environment
+DERIVED_FIELDS = {
+    'ACTIVE_RPC': Optional[str],
+    'ACTIVE_WS': Optional[str],
+    'ACTIVE_CHAIN_ID': int,
+}
+
+
+def _field_type(parser, default):
+    field_type = bool if parser is _parse_bool else parser
+    return Optional[field_type] if default is None else field_type
+
+
+Config = make_dataclass(
+    'Config',
+    [(name, _field_type(parser, default)) for name, (_, parser, default) in SCHEMA.items()]
+    + list(DERIVED_FIELDS.items()),
+    slots=True,
+    frozen=True,
+)
+Config.__module__ = __name__
+Config.__doc__ = """
+    Immutable, process-wide configuration generated from SCHEMA.
+
+    Built once by get_config(); all environment lookups and type coercions
+    happen at construction time so attribute reads are plain slot loads.
+    """
+
+
+def _parse(env: dict, env_key: str, parser, default):
+    raw = env.get(env_key)
+    if raw is None:
+        return default
+    return parser(raw)
+
+
+def _coerce(env: dict) -> dict:
+    """Resolve every SCHEMA field from an env mapping."""
+    return {
+        name: _parse(env, env_key, parser, default)
+        for name, (env_key, parser, default) in SCHEMA.items()
+    }
+
+
+def write_validated_snapshot(env: dict, env_stat: os.stat_result) -> None:
+    """
+    Store the fully coerced .env settings for fast startup.
+
+    Called by scripts/validate_config.py after a successful validation, with
+    the same parsed .env it validated. The snapshot holds values from .env
+    only (not the process environment) and is keyed on .env's mtime/size, so
+    editing .env invalidates it. Like the parse cache it holds secrets, so
+    it is written owner-only.
+
+    Args:
+        env: Parsed .env values (from _parse_env_text)
+        env_stat: stat of .env taken before it was read
+
+    Raises:
+        ValueError: If a value cannot be coerced to its field type
+        OSError: If the snapshot cannot be written
+    """
+    values = _coerce(env)
+    _write_private_json(env_snapshot_path, {'key': _env_cache_key(env_stat), 'values': values})
+
+
+def _read_validated_snapshot(env_stat: os.stat_result) -> Optional[dict]:
+    """Return snapshot values if a snapshot matching the current .env exists."""
+    try:
+        with open(env_snapshot_path, 'r') as f:
+            snapshot = json.load(f)
+        if snapshot.get('key') == _env_cache_key(env_stat) and snapshot['values'].keys() == SCHEMA.keys():
+            return snapshot['values']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Load .env and build the configuration singleton.
+
+    Cached so the .env parse and every os.getenv/type coercion runs exactly
+    once per process, no matter how many modules import the config.
+    """
+    env_stat = _ensure_env_file()
+    snapshot = _read_validated_snapshot(env_stat)
+
+    if snapshot is not None:
+        # Validated snapshot: .env isn't read at all. Variables set in the
+        # process environment still take precedence, as with .env loading.
+        env = os.environ.copy()
+        values = {
+            name: _parse(env, env_key, parser, default) if env_key in env else snapshot[name]
+            for name, (env_key, parser, default) in SCHEMA.items()
+        }
+    else:
+        _load_env(env_stat)
+
+        # One snapshot of the environment; every field is then a plain dict lookup
+        values = _coerce(os.environ.copy())
+
+    # Get active RPC based on mode
+    testnet = values['NETWORK_MODE'] == 'testnet'
+    values['ACTIVE_RPC'] = values['SCROLL_TESTNET_RPC'] if testnet else values['SCROLL_RPC_URL']
+    values['ACTIVE_WS'] = values['SCROLL_TESTNET_WS'] if testnet else values['SCROLL_WS_URL']
+    values['ACTIVE_CHAIN_ID'] = 534351 if testnet else values['CHAIN_ID']
+
+    return Config(**values)
+
 
-config = Config()
+config = get_config()
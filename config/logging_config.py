@@ -2,13 +2,45 @@
 Logging configuration for the Sonicarbi arbitrage bot.
 
 Sets up structured logging with file and console handlers.
+
+Records go to a QueueHandler on the calling thread. Its prepare() step still
+formats there: the message is merged with its arguments and any traceback
+is rendered before the queue put. Only the timestamp/level line layout and
+all console/file I/O happen on the background QueueListener thread, so the
+scanner's hot path never blocks on a write.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from typing import Optional
+
+# Background listener that owns the real handlers (see setup_logging)
+_listener: Optional[QueueListener] = None
+
+# Logger for pre-formatted (e.g. colorized) console blocks. Its records are
+# written to stdout verbatim, through the same listener as regular logs so
+# the two never interleave out of order, and are kept out of the log file.
+CONSOLE_LOGGER_NAME = 'sonicarbi.console'
+
+
+def _is_console_output(record: logging.LogRecord) -> bool:
+    return record.name == CONSOLE_LOGGER_NAME
+
+
+def _is_log_record(record: logging.LogRecord) -> bool:
+    return record.name != CONSOLE_LOGGER_NAME
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.Logger:
@@ -22,6 +54,14 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.
     Returns:
         Root logger instance
     """
+    global _listener
+
+    # Skip per-record work we never format (thread/process names, caller lookup)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Create logs directory
     log_dir = Path(__file__).parent.parent / 'logs'
     log_dir.mkdir(exist_ok=True)
@@ -36,30 +76,51 @@ def setup_logging(log_level: str = "INFO", log_to_file: bool = True) -> logging.
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers and stop any previous listener
     logger.handlers.clear()
+    shutdown_logging()
+    handlers = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.addFilter(_is_log_record)
+    handlers.append(console_handler)
+
+    # Raw console output, written as is
+    raw_console_handler = logging.StreamHandler(sys.stdout)
+    raw_console_handler.addFilter(_is_console_output)
+    handlers.append(raw_console_handler)
+    logging.getLogger(CONSOLE_LOGGER_NAME).setLevel(logging.INFO)
 
-    # File handler with rotation
+    # File handler, rotated at midnight (UTC) so a long-running scanner
+    # doesn't keep writing into the file named after its start date
     if log_to_file:
-        log_file = log_dir / f'scanner_{datetime.now().strftime("%Y%m%d")}.log'
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+        file_handler = TimedRotatingFileHandler(
+            log_dir / 'scanner.log',
+            when='midnight',
+            backupCount=5,
+            utc=True
         )
         file_handler.setLevel(logging.DEBUG)  # Log everything to file
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.addFilter(_is_log_record)
+        handlers.append(file_handler)
+
+    # Only the queue handler lives on the root logger; the listener thread
+    # lays out the final lines and writes to the real handlers
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
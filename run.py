@@ -6,16 +6,15 @@ Usage:
     python run.py
 """
 
-import asyncio
 import sys
-from src.scanner import ScrollDEXScanner
+from src.scanner import ScrollDEXScanner, run_event_loop
 
 def main():
     """Run the scanner"""
     try:
         print("Starting Sonicarbi Flashloan Arbitrage Bot...")
         scanner = ScrollDEXScanner()
-        asyncio.run(scanner.run_continuous_scan())
+        run_event_loop(scanner.run_continuous_scan())
     except KeyboardInterrupt:
         print("\n\nShutting down gracefully...")
         sys.exit(0)
@@ -5,15 +5,74 @@ Configuration validation script for Sonicarbi.
 Validates that all required configuration is present and correctly formatted.
 """
 
+import asyncio
 import os
+import re
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from dotenv import load_dotenv
-from web3 import Web3
+# web3 and the config package are imported lazily inside the functions that
+# need them: web3 alone takes hundreds of ms to import, which is wasted when
+# the script exits early on a missing .env.
+
+_ADDRESS_RE = re.compile(r'^0x[0-9a-fA-F]{40}$').match
+
+
+def is_valid_address(address: str) -> bool:
+    """
+    Validate an Ethereum address.
+
+    Same rules as Web3.is_address, but only mixed-case input pays for the
+    keccak-based EIP-55 checksum; all-lower/all-upper hex is accepted as is.
+    """
+    if not _ADDRESS_RE(address):
+        return False
+    body = address[2:]
+    if body.islower() or body.isupper() or body.isdigit():
+        return True
+
+    from web3 import Web3
+    return Web3.to_checksum_address(address) == address
+
+
+def is_hex_private_key(private_key: str) -> bool:
+    """Check for exactly 64 hex characters using a single C-level decode."""
+    if len(private_key) != 64:
+        return False
+    try:
+        # fromhex skips whitespace, so also check the decoded length
+        return len(bytes.fromhex(private_key)) == 32
+    except ValueError:
+        return False
+
+
+async def _probe_rpc(rpc_url: str) -> int:
+    """Return the latest block number from an RPC endpoint."""
+    from web3 import AsyncWeb3
+
+    w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+    return await w3.eth.block_number
+
+
+async def probe_rpcs(rpc_urls: dict) -> dict:
+    """
+    Probe several RPC endpoints concurrently.
+
+    Args:
+        rpc_urls: Mapping of label -> RPC URL
+
+    Returns:
+        Mapping of label -> latest block number, or the raised exception
+    """
+    labels = list(rpc_urls)
+    results = await asyncio.gather(
+        *(_probe_rpc(rpc_urls[label]) for label in labels),
+        return_exceptions=True
+    )
+    return dict(zip(labels, results))
 
 
 def validate_config():
@@ -29,7 +88,27 @@ def validate_config():
         print("   Copy config/.env.example to config/.env and configure it")
         return False
 
-    load_dotenv(env_path)
+    # Importing the config package also builds the bot's Config, which
+    # raises on values it cannot coerce; the bot would fail the same way
+    try:
+        from config.config import SCHEMA, _parse_env_text, write_validated_snapshot
+    except ValueError as e:
+        print(f"❌ Invalid setting in .env or the environment: {e}")
+        return False
+
+    # Parse .env exactly as the bot's loader does. stat before reading, so an
+    # edit in between invalidates the snapshot rather than mislabelling it.
+    env_stat = os.stat(env_path)
+    env_file = _parse_env_text(env_path.read_text(encoding='utf-8'))
+
+    # Validate the values the bot will actually run with: variables set in
+    # the process environment take precedence over .env
+    overrides = {
+        env_key: os.environ[env_key]
+        for env_key, _, _ in SCHEMA.values()
+        if env_key in os.environ
+    }
+    env = {**env_file, **overrides}
     all_valid = True
 
     # Required settings
@@ -42,7 +121,7 @@ def validate_config():
     }
 
     for key, description in required.items():
-        value = os.getenv(key)
+        value = env.get(key)
         if not value:
             print(f"   ❌ {key}: MISSING ({description})")
             all_valid = False
@@ -51,9 +130,9 @@ def validate_config():
 
     # Validate private key format
     print("\n🔐 Private Key Validation:")
-    private_key = os.getenv('PRIVATE_KEY', '')
+    private_key = env.get('PRIVATE_KEY', '')
     if private_key:
-        if len(private_key) == 64 and all(c in '0123456789abcdefABCDEF' for c in private_key):
+        if is_hex_private_key(private_key):
             print("   ✅ Private key format valid (64 hex characters)")
         elif len(private_key) == 66 and private_key.startswith('0x'):
             print("   ⚠️  Private key starts with '0x' - remove it!")
@@ -68,7 +147,7 @@ def validate_config():
 
     # Validate network mode
     print("\n🌐 Network Configuration:")
-    network_mode = os.getenv('NETWORK_MODE', '').lower()
+    network_mode = env.get('NETWORK_MODE', '').lower()
     if network_mode in ['mainnet', 'testnet']:
         print(f"   ✅ Network mode: {network_mode}")
     else:
@@ -76,27 +155,32 @@ def validate_config():
         print("      Must be 'mainnet' or 'testnet'")
         all_valid = False
 
-    # Test RPC connectivity
+    # Test RPC connectivity (mainnet and testnet probed concurrently)
     print("\n🔌 RPC Connectivity:")
-    if network_mode == 'testnet':
-        rpc_url = os.getenv('SCROLL_TESTNET_RPC')
-        print(f"   Testing testnet RPC: {rpc_url}")
-    else:
-        rpc_url = os.getenv('SCROLL_RPC_URL')
-        print(f"   Testing mainnet RPC: {rpc_url}")
-
-    if rpc_url:
-        try:
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
-            if w3.is_connected():
-                block = w3.eth.block_number
-                print(f"   ✅ RPC connected (latest block: {block})")
+    active_label = 'testnet' if network_mode == 'testnet' else 'mainnet'
+    rpc_urls = {
+        label: url for label, url in (
+            ('mainnet', env.get('SCROLL_RPC_URL')),
+            ('testnet', env.get('SCROLL_TESTNET_RPC')),
+        ) if url
+    }
+
+    if active_label in rpc_urls:
+        for label, url in rpc_urls.items():
+            print(f"   Testing {label} RPC: {url}")
+
+        results = asyncio.run(probe_rpcs(rpc_urls))
+
+        for label, result in results.items():
+            is_active = label == active_label
+            if isinstance(result, Exception):
+                if is_active:
+                    print(f"   ❌ {label} RPC connection error: {result}")
+                    all_valid = False
+                else:
+                    print(f"   ⚠️  {label} RPC connection error (not active): {result}")
             else:
-                print("   ❌ RPC connection failed")
-                all_valid = False
-        except Exception as e:
-            print(f"   ❌ RPC connection error: {e}")
-            all_valid = False
+                print(f"   ✅ {label} RPC connected (latest block: {result})")
     else:
         print("   ❌ RPC URL not configured")
         all_valid = False
@@ -111,22 +195,23 @@ def validate_config():
     }
 
     for key, (description, type_func, default) in optional.items():
-        value = os.getenv(key)
+        value = env.get(key)
         if value:
             try:
                 parsed = type_func(value)
                 print(f"   ✅ {key}: {parsed} ({description})")
             except ValueError:
-                print(f"   ⚠️  {key}: Invalid format - using default {default}")
+                print(f"   ❌ {key}: Invalid format ({description})")
+                all_valid = False
         else:
             print(f"   ℹ️  {key}: Not set - using default {default}")
 
     # Notification settings
     print("\n📢 Notification Settings:")
-    telegram_enabled = os.getenv('ENABLE_TELEGRAM_ALERTS', 'false').lower() == 'true'
-    telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
-    telegram_chat = os.getenv('TELEGRAM_CHAT_ID')
-    discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
+    telegram_enabled = env.get('ENABLE_TELEGRAM_ALERTS', 'false').lower() == 'true'
+    telegram_token = env.get('TELEGRAM_BOT_TOKEN')
+    telegram_chat = env.get('TELEGRAM_CHAT_ID')
+    discord_webhook = env.get('DISCORD_WEBHOOK_URL')
 
     if telegram_enabled:
         if telegram_token and telegram_chat:
@@ -146,9 +231,9 @@ def validate_config():
 
     # Chainlink settings
     print("\n🔮 Price Oracle Settings:")
-    chainlink_eth = os.getenv('CHAINLINK_ETH_USD')
+    chainlink_eth = env.get('CHAINLINK_ETH_USD')
     if chainlink_eth:
-        if Web3.is_address(chainlink_eth):
+        if is_valid_address(chainlink_eth):
             print(f"   ✅ Chainlink ETH/USD feed: {chainlink_eth}")
         else:
             print(f"   ❌ Invalid Chainlink address: {chainlink_eth}")
@@ -159,6 +244,18 @@ def validate_config():
     # Summary
     print("\n" + "=" * 60)
     if all_valid:
+        # Let the bot start from the coerced settings without re-reading
+        # .env. The snapshot stores .env alone, so only write it when .env
+        # itself is what was validated.
+        if overrides:
+            print(f"ℹ️  Not writing config snapshot: {', '.join(sorted(overrides))} "
+                  f"set in the environment override .env")
+        else:
+            try:
+                write_validated_snapshot(env_file, env_stat)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not write validated config snapshot: {e}")
+
         print("✅ Configuration is VALID - Ready to run!")
         print("\n🚀 Next steps:")
         print("   1. Run tests: pytest -v")
@@ -3,12 +3,13 @@ Source code module for Sonicarbi flashloan arbitrage bot.
 """
 
 from .scanner import ScrollDEXScanner
-from .database import Database
+from .database import Database, AsyncDatabase
 from .concentrated_liquidity import ConcentratedLiquidityManager, AmbientPriceFetcher, iZiSwapPriceFetcher
 
 __all__ = [
     'ScrollDEXScanner',
     'Database',
+    'AsyncDatabase',
     'ConcentratedLiquidityManager',
     'AmbientPriceFetcher',
     'iZiSwapPriceFetcher'
@@ -7,13 +7,99 @@ These DEXes use different pricing models than Uniswap V2.
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from web3 import Web3
-from typing import Dict, Optional
+from web3.contract import Contract
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config.config import config
+from utils.multicall import Multicall, decode_results
+from utils.addresses import checksum_address
+
+
+# Contract addresses on Scroll, already in EIP-55 checksum form so no
+# keccak is needed to use them
+_CROC_QUERY_ADDRESS = '0x62223e90605845Cf5CC6DAE6E0de4CDA130d6DDf'
+# Note: This is the LiquidityManager address from config
+# The actual Quoter address needs to be verified
+_QUOTER_ADDRESS = '0x1502d025BfA624469892289D45C0352997251728'
+
+# CrocQuery ABI - minimal for queryPrice
+_CROC_QUERY_ABI = json.loads('''[
+    {
+        "inputs": [
+            {"internalType": "address", "name": "base", "type": "address"},
+            {"internalType": "address", "name": "quote", "type": "address"},
+            {"internalType": "uint256", "name": "poolIdx", "type": "uint256"}
+        ],
+        "name": "queryPrice",
+        "outputs": [{"internalType": "uint128", "name": "", "type": "uint128"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]''')
+
+# Uniswap V3 style Quoter ABI (minimal)
+# iZiSwap follows similar patterns
+_QUOTER_ABI = json.loads('''[
+    {
+        "inputs": [
+            {"internalType": "bytes", "name": "path", "type": "bytes"},
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"}
+        ],
+        "name": "quoteExactInput",
+        "outputs": [
+            {"internalType": "uint256", "name": "amountOut", "type": "uint256"}
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]''')
+
+_ABIS = {
+    'croc_query': _CROC_QUERY_ABI,
+    'quoter': _QUOTER_ABI,
+}
+
+# queryPrice(address,address,uint256)
+_QUERY_PRICE_SELECTOR = bytes.fromhex('f8c7efa7')
+
+
+@lru_cache(maxsize=128)
+def _get_contract(w3: Web3, address: str, abi_name: str) -> Contract:
+    """
+    Build (once) the contract object for an address/ABI pair on a Web3 instance.
+
+    Fetchers are re-created freely; this keeps them from re-walking the ABI
+    and allocating a fresh contract object each time. The address must
+    already be checksummed.
+    """
+    return w3.eth.contract(address=address, abi=_ABIS[abi_name])
+
+
+@lru_cache(maxsize=1024)
+def _query_price_calldata(base: str, quote: str, pool_idx: int) -> bytes:
+    """
+    ABI-encoded queryPrice calldata for a pool.
+
+    All arguments are static words, so the encoding is a straight
+    concatenation; it is cached because a pool's arguments never change.
+    """
+    return b''.join((
+        _QUERY_PRICE_SELECTOR,
+        bytes(12) + bytes.fromhex(base[2:]),
+        bytes(12) + bytes.fromhex(quote[2:]),
+        pool_idx.to_bytes(32, 'big'),
+    ))
+
+
+def _scale(token: Dict) -> int:
+    """10 ** decimals for a token, using the scanner's precomputed value when present."""
+    scale = token.get('_scale')
+    return scale if scale is not None else 10 ** token['decimals']
 
 
 class AmbientPriceFetcher:
@@ -28,31 +114,65 @@ class AmbientPriceFetcher:
         self.w3 = w3
 
         # CrocQuery contract address on Scroll
-        self.croc_query_address = "0x62223e90605845Cf5CC6DAE6E0de4CDA130d6DDf"
-
-        # CrocQuery ABI - minimal for queryPrice
-        self.croc_query_abi = json.loads('''[
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "base", "type": "address"},
-                    {"internalType": "address", "name": "quote", "type": "address"},
-                    {"internalType": "uint256", "name": "poolIdx", "type": "uint256"}
-                ],
-                "name": "queryPrice",
-                "outputs": [{"internalType": "uint128", "name": "", "type": "uint128"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]''')
-
-        self.contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.croc_query_address),
-            abi=self.croc_query_abi
-        )
+        self.croc_query_address = _CROC_QUERY_ADDRESS
+
+        self.croc_query_abi = _CROC_QUERY_ABI
+        self.contract = _get_contract(self.w3, self.croc_query_address, 'croc_query')
+        self.multicall = Multicall(self.w3)
 
         # Default pool index for standard pools
         self.default_pool_idx = 420
 
+    @staticmethod
+    def _order_tokens(token_in: Dict, token_out: Dict) -> Tuple[str, str, bool]:
+        """
+        Order a token pair the way Ambient expects.
+
+        Returns:
+            (base, quote, is_buy) where is_buy means token_in is the quote token
+        """
+        addr_in = checksum_address(token_in['address'])
+        addr_out = checksum_address(token_out['address'])
+
+        # Ambient requires base < quote (smaller address first). Comparing the
+        # numeric values avoids lower-casing both strings on every quote.
+        if int(addr_in, 16) < int(addr_out, 16):
+            return addr_in, addr_out, False  # Selling base for quote
+        return addr_out, addr_in, True  # Buying base with quote
+
+    @staticmethod
+    def _amount_out(
+        sqrt_price_q64: int,
+        is_buy: bool,
+        token_in: Dict,
+        token_out: Dict,
+        amount_in: float
+    ) -> float:
+        """Convert a Q64.64 sqrt price into the output amount for amount_in."""
+        # The sqrt price is Q64.64 fixed point, so price = sqrt_price_q64**2 / 2**128.
+        # Do the whole conversion in exact integer math and only go to float
+        # once at the end.
+        #
+        # WARNING: This calculation assumes the price from queryPrice is a ratio of wei amounts.
+        # If Ambient returns price as a ratio of token amounts (accounting for decimals),
+        # this calculation will be incorrect by a factor of 10^(decimals_in - decimals_out).
+        # TODO: Verify with real mainnet data and adjust if needed.
+        # See CL_AUDIT_FINDINGS.md for details.
+        amount_in_wei = int(amount_in * _scale(token_in))
+        price_x128 = sqrt_price_q64 * sqrt_price_q64
+
+        if not is_buy:
+            amount_out_wei = (amount_in_wei * price_x128) >> 128
+        elif price_x128:
+            # Buying base with quote: divide by the price instead
+            amount_out_wei = (amount_in_wei << 128) // price_x128
+        else:
+            amount_out_wei = 0
+
+        amount_out = amount_out_wei / _scale(token_out)
+
+        return amount_out
+
     def get_price(self, token_in: Dict, token_out: Dict, amount_in: float) -> Optional[float]:
         """
         Get price from Ambient Finance.
@@ -66,44 +186,14 @@ class AmbientPriceFetcher:
             Amount of token_out received, or None if query fails
         """
         try:
-            addr_in = Web3.to_checksum_address(token_in['address'])
-            addr_out = Web3.to_checksum_address(token_out['address'])
-
-            # Ambient requires base < quote (smaller address first)
-            if addr_in.lower() < addr_out.lower():
-                base, quote = addr_in, addr_out
-                is_buy = False  # Selling base for quote
-            else:
-                base, quote = addr_out, addr_in
-                is_buy = True  # Buying base with quote
+            base, quote, is_buy = self._order_tokens(token_in, token_out)
 
             # Query the current price (sqrt price in Q64.64 format)
             sqrt_price_q64 = self.contract.functions.queryPrice(
                 base, quote, self.default_pool_idx
             ).call()
 
-            # Convert Q64.64 fixed point to float
-            # Q64.64 means 64 bits for integer part, 64 bits for fractional part
-            sqrt_price = float(sqrt_price_q64) / (2 ** 64)
-
-            # Price is the square of sqrt_price
-            price = sqrt_price ** 2
-
-            # If we're buying base with quote, invert the price
-            if is_buy:
-                price = 1.0 / price if price > 0 else 0
-
-            # Calculate output amount
-            # WARNING: This calculation assumes the price from queryPrice is a ratio of wei amounts.
-            # If Ambient returns price as a ratio of token amounts (accounting for decimals),
-            # this calculation will be incorrect by a factor of 10^(decimals_in - decimals_out).
-            # TODO: Verify with real mainnet data and adjust if needed.
-            # See CL_AUDIT_FINDINGS.md for details.
-            amount_in_adjusted = amount_in * (10 ** token_in['decimals'])
-            amount_out_adjusted = amount_in_adjusted * price
-            amount_out = amount_out_adjusted / (10 ** token_out['decimals'])
-
-            return amount_out
+            return self._amount_out(sqrt_price_q64, is_buy, token_in, token_out, amount_in)
 
         except Exception as e:
             # Log errors if debug mode is enabled
@@ -112,6 +202,53 @@ class AmbientPriceFetcher:
                 print(f"[DEBUG] Ambient price fetch failed for {token_in.get('symbol', '?')}/{token_out.get('symbol', '?')}: {str(e)}")
             return None
 
+    def get_prices(
+        self,
+        quotes: List[Tuple[Dict, Dict, float]]
+    ) -> List[Optional[float]]:
+        """
+        Get prices for many pairs with a single Multicall3 round trip.
+
+        Args:
+            quotes: List of (token_in, token_out, amount_in) tuples
+
+        Returns:
+            Output amounts in the same order as quotes (None where the query failed)
+        """
+        prices: List[Optional[float]] = [None] * len(quotes)
+        calls = []
+        call_meta = []
+
+        for i, (token_in, token_out, amount_in) in enumerate(quotes):
+            try:
+                base, quote, is_buy = self._order_tokens(token_in, token_out)
+                calldata = _query_price_calldata(base, quote, self.default_pool_idx)
+            except Exception as e:
+                if config.DEBUG_MODE:
+                    print(f"[DEBUG] Ambient quote encoding failed: {str(e)}")
+                continue
+
+            calls.append((self.croc_query_address, calldata))
+            call_meta.append((i, is_buy))
+
+        if not calls:
+            return prices
+
+        try:
+            results = decode_results(self.multicall.try_aggregate(calls), ['uint128'])
+        except Exception as e:
+            if config.DEBUG_MODE:
+                print(f"[DEBUG] Ambient batch price fetch failed: {str(e)}")
+            return prices
+
+        for (i, is_buy), decoded in zip(call_meta, results):
+            if decoded is None:
+                continue
+            token_in, token_out, amount_in = quotes[i]
+            prices[i] = self._amount_out(decoded[0], is_buy, token_in, token_out, amount_in)
+
+        return prices
+
 
 class iZiSwapPriceFetcher:
     """
@@ -127,35 +264,24 @@ class iZiSwapPriceFetcher:
         self.w3 = w3
 
         # iZiSwap Quoter contract address on Scroll
-        # Note: This is the LiquidityManager address from config
-        # The actual Quoter address needs to be verified
-        self.quoter_address = "0x1502d025BfA624469892289D45C0352997251728"
-
-        # Uniswap V3 style Quoter ABI (minimal)
-        # iZiSwap follows similar patterns
-        self.quoter_abi = json.loads('''[
-            {
-                "inputs": [
-                    {"internalType": "bytes", "name": "path", "type": "bytes"},
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"}
-                ],
-                "name": "quoteExactInput",
-                "outputs": [
-                    {"internalType": "uint256", "name": "amountOut", "type": "uint256"}
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]''')
-
-        # Note: This may not work without the correct Quoter contract address
-        try:
-            self.contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(self.quoter_address),
-                abi=self.quoter_abi
-            )
-        except Exception:
-            self.contract = None
+        self.quoter_address = _QUOTER_ADDRESS
+
+        self.quoter_abi = _QUOTER_ABI
+
+        # Built on first use; get_price doesn't query the Quoter yet
+        self._contract: Optional[Contract] = None
+        self._contract_failed = False
+
+    @property
+    def contract(self) -> Optional[Contract]:
+        """Quoter contract, constructed lazily (None if construction fails)."""
+        if self._contract is None and not self._contract_failed:
+            # Note: This may not work without the correct Quoter contract address
+            try:
+                self._contract = _get_contract(self.w3, self.quoter_address, 'quoter')
+            except Exception:
+                self._contract_failed = True
+        return self._contract
 
     def get_price(self, token_in: Dict, token_out: Dict, amount_in: float) -> Optional[float]:
         """
@@ -176,6 +302,17 @@ class iZiSwapPriceFetcher:
         # TODO: Update with correct Quoter address from iZiSwap docs
         return None
 
+    def get_prices(
+        self,
+        quotes: List[Tuple[Dict, Dict, float]]
+    ) -> List[Optional[float]]:
+        """
+        Get prices for many pairs at once.
+
+        Returns None for every pair until the Quoter address is configured.
+        """
+        return [self.get_price(token_in, token_out, amount_in) for token_in, token_out, amount_in in quotes]
+
 
 class ConcentratedLiquidityManager:
     """
@@ -187,6 +324,12 @@ class ConcentratedLiquidityManager:
         self.ambient = AmbientPriceFetcher(w3)
         self.iziswap = iZiSwapPriceFetcher(w3)
 
+        # DEX name -> fetcher, so each quote is one dict lookup
+        self._fetchers = {
+            sys.intern('Ambient'): self.ambient,
+            sys.intern('iZiSwap'): self.iziswap,
+        }
+
     def get_price(self, dex_name: str, token_in: Dict, token_out: Dict,
                   amount_in: float) -> Optional[float]:
         """
@@ -201,9 +344,27 @@ class ConcentratedLiquidityManager:
         Returns:
             Output amount or None if unsupported/failed
         """
-        if dex_name == "Ambient":
-            return self.ambient.get_price(token_in, token_out, amount_in)
-        elif dex_name == "iZiSwap":
-            return self.iziswap.get_price(token_in, token_out, amount_in)
-        else:
+        fetcher = self._fetchers.get(dex_name)
+        if fetcher is None:
             return None
+        return fetcher.get_price(token_in, token_out, amount_in)
+
+    def batch_get_prices(
+        self,
+        dex_name: str,
+        quotes: List[Tuple[Dict, Dict, float]]
+    ) -> List[Optional[float]]:
+        """
+        Get prices for many pairs on one concentrated liquidity DEX.
+
+        Args:
+            dex_name: Name of the DEX ('Ambient', 'iZiSwap', etc.)
+            quotes: List of (token_in, token_out, amount_in) tuples
+
+        Returns:
+            Output amounts in the same order as quotes (None if unsupported/failed)
+        """
+        fetcher = self._fetchers.get(dex_name)
+        if fetcher is None:
+            return [None] * len(quotes)
+        return fetcher.get_prices(quotes)
@@ -1,16 +1,126 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
 from datetime import datetime
+import asyncio
 import sys
+import threading
+import weakref
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config.config import config
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+OPPORTUNITY_COLUMNS = (
+    'token_in', 'token_out', 'buy_dex', 'sell_dex',
+    'buy_price', 'sell_price', 'profit_pct', 'profit_usd', 'amount'
+)
+
+SCHEMA_STATEMENTS = (
+    # Opportunities table
+    """
+    CREATE TABLE IF NOT EXISTS opportunities (
+        id SERIAL PRIMARY KEY,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        token_in VARCHAR(50),
+        token_out VARCHAR(50),
+        buy_dex VARCHAR(50),
+        sell_dex VARCHAR(50),
+        buy_price DECIMAL(20,8),
+        sell_price DECIMAL(20,8),
+        profit_pct DECIMAL(10,4),
+        profit_usd DECIMAL(10,2),
+        amount DECIMAL(20,8),
+        executed BOOLEAN DEFAULT FALSE
+    )
+    """,
+
+    # Partial index for get_unexecuted_opportunities: only unexecuted
+    # rows are indexed, already sorted by profit
+    """
+    CREATE INDEX IF NOT EXISTS idx_opp_unexec_profit
+    ON opportunities (profit_pct DESC)
+    WHERE executed = FALSE
+    """,
+
+    # Executions table
+    """
+    CREATE TABLE IF NOT EXISTS executions (
+        id SERIAL PRIMARY KEY,
+        opportunity_id INTEGER REFERENCES opportunities(id),
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        tx_hash VARCHAR(66),
+        success BOOLEAN,
+        actual_profit_usd DECIMAL(10,2),
+        gas_used INTEGER,
+        gas_price_gwei DECIMAL(10,4),
+        error_message TEXT
+    )
+    """,
+
+    # Gas prices table
+    """
+    CREATE TABLE IF NOT EXISTS gas_prices (
+        id SERIAL PRIMARY KEY,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        gas_price_gwei DECIMAL(10,4),
+        network VARCHAR(20)
+    )
+    """,
+)
+
+INSERT_OPPORTUNITY_SQL = f"""
+    INSERT INTO opportunities ({', '.join(OPPORTUNITY_COLUMNS)})
+    VALUES ({', '.join(f'${i}' for i in range(1, len(OPPORTUNITY_COLUMNS) + 1))})
+    RETURNING id
+"""
+
+# One statement for a whole batch: each column is sent as a single array
+# parameter over asyncpg's binary protocol and unnested server-side
+INSERT_OPPORTUNITIES_UNNEST_SQL = f"""
+    INSERT INTO opportunities ({', '.join(OPPORTUNITY_COLUMNS)})
+    SELECT * FROM unnest(
+        $1::varchar[], $2::varchar[], $3::varchar[], $4::varchar[],
+        $5::numeric[], $6::numeric[], $7::numeric[], $8::numeric[], $9::numeric[]
+    )
+    RETURNING id
+"""
+
+# Opportunity rows are a high-volume, re-derivable log: their transactions
+# skip waiting for the WAL flush at commit. A crash can lose the last few
+# hundred milliseconds of rows but never corrupts the table. Other tables keep
+# fully durable commits.
+ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit TO OFF"
+
+SELECT_UNEXECUTED_SQL = """
+    SELECT * FROM opportunities
+    WHERE executed = FALSE AND profit_pct >= $1
+    ORDER BY profit_pct DESC
+"""
+
+# psycopg2 counterpart of SELECT_UNEXECUTED_SQL, for the named cursor in
+# Database.get_unexecuted_opportunities (a server-side cursor can't be
+# declared over a prepared statement)
+SELECT_UNEXECUTED_PSYCOPG_SQL = """
+    SELECT * FROM opportunities
+    WHERE executed = FALSE AND profit_pct >= %s
+    ORDER BY profit_pct DESC
+"""
+
+
+def _opportunity_row(opp):
+    return tuple(opp[column] for column in OPPORTUNITY_COLUMNS)
+
 
 class Database:
     def __init__(self):
-        self.conn = psycopg2.connect(config.DATABASE_URL)
+        self.pool = ThreadedConnectionPool(2, 10, config.DATABASE_URL)
+        self._prepared_conns = weakref.WeakSet()
+        self._prepared_lock = threading.Lock()
         self.create_tables()
 
     def __enter__(self):
@@ -23,89 +133,205 @@ class Database:
         return False
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close all pooled database connections"""
+        if self.pool:
+            self.pool.closeall()
+
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection, committing on success"""
+        conn = self.pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
 
     def create_tables(self):
         """Create database schema"""
-        cursor = self.conn.cursor()
-
-        # Opportunities table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS opportunities (
-                id SERIAL PRIMARY KEY,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                token_in VARCHAR(50),
-                token_out VARCHAR(50),
-                buy_dex VARCHAR(50),
-                sell_dex VARCHAR(50),
-                buy_price DECIMAL(20,8),
-                sell_price DECIMAL(20,8),
-                profit_pct DECIMAL(10,4),
-                profit_usd DECIMAL(10,2),
-                amount DECIMAL(20,8),
-                executed BOOLEAN DEFAULT FALSE
-            )
-        """)
-
-        # Executions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS executions (
-                id SERIAL PRIMARY KEY,
-                opportunity_id INTEGER REFERENCES opportunities(id),
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                tx_hash VARCHAR(66),
-                success BOOLEAN,
-                actual_profit_usd DECIMAL(10,2),
-                gas_used INTEGER,
-                gas_price_gwei DECIMAL(10,4),
-                error_message TEXT
-            )
-        """)
-
-        # Gas prices table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS gas_prices (
-                id SERIAL PRIMARY KEY,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                gas_price_gwei DECIMAL(10,4),
-                network VARCHAR(20)
-            )
-        """)
-
-        self.conn.commit()
-        cursor.close()
+        with self._conn() as conn, conn.cursor() as cursor:
+            for statement in SCHEMA_STATEMENTS:
+                cursor.execute(statement)
         print("✅ Database tables created successfully")
 
+    def _ensure_prepared(self, conn):
+        """PREPARE the hot insert once per server session.
+
+        Prepared statements live in the backend session, which lasts exactly
+        as long as the connection object. Prepared connections are tracked
+        in a WeakSet, so a reconnect (a new connection object) is prepared
+        again and closed connections drop out on their own.
+        """
+        with self._prepared_lock:
+            if conn in self._prepared_conns:
+                return
+
+        with conn.cursor() as cursor:
+            cursor.execute("PREPARE ins_opp AS" + INSERT_OPPORTUNITY_SQL)
+        with self._prepared_lock:
+            self._prepared_conns.add(conn)
+
     def insert_opportunity(self, opp):
         """Insert opportunity into database"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO opportunities
-            (token_in, token_out, buy_dex, sell_dex, buy_price, sell_price, profit_pct, profit_usd, amount)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (
-            opp['token_in'], opp['token_out'], opp['buy_dex'], opp['sell_dex'],
-            opp['buy_price'], opp['sell_price'], opp['profit_pct'], opp['profit_usd'], opp['amount']
-        ))
-        opp_id = cursor.fetchone()[0]
-        self.conn.commit()
-        cursor.close()
-        return opp_id
-
-    def get_unexecuted_opportunities(self):
-        """Get all unexecuted profitable opportunities"""
-        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute("""
-            SELECT * FROM opportunities
-            WHERE executed = FALSE AND profit_pct >= %s
-            ORDER BY profit_pct DESC
-        """, (config.PROFIT_THRESHOLD * 100,))
-        results = cursor.fetchall()
-        cursor.close()
-        return results
+        with self._conn() as conn:
+            self._ensure_prepared(conn)
+            with conn.cursor() as cursor:
+                cursor.execute(ASYNC_COMMIT_SQL)
+                cursor.execute(
+                    "EXECUTE ins_opp (%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                    _opportunity_row(opp)
+                )
+                return cursor.fetchone()[0]
+
+    def insert_opportunities_batch(self, opps):
+        """Insert many opportunities in one multi-row INSERT and commit.
+
+        Returns the new row ids in the same order as opps.
+        """
+        if not opps:
+            return []
+
+        rows = [_opportunity_row(opp) for opp in opps]
+        with self._conn() as conn, conn.cursor() as cursor:
+            cursor.execute(ASYNC_COMMIT_SQL)
+            results = execute_values(cursor, f"""
+                INSERT INTO opportunities ({', '.join(OPPORTUNITY_COLUMNS)})
+                VALUES %s
+                RETURNING id
+            """, rows, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s)", page_size=500, fetch=True)
+        return [row[0] for row in results]
+
+    def get_unexecuted_opportunities(self, batch_size=500):
+        """Stream unexecuted profitable opportunities from a server-side cursor.
+
+        Rows arrive batch_size at a time, so memory stays bounded however
+        large the backlog is. The pooled connection is held until the
+        generator is exhausted or closed.
+        """
+        with self._conn() as conn:
+            with conn.cursor(name='unexec_opp', cursor_factory=RealDictCursor) as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(SELECT_UNEXECUTED_PSYCOPG_SQL, (config.PROFIT_THRESHOLD * 100,))
+                yield from cursor
+
+
+class AsyncDatabase:
+    """
+    asyncpg-backed counterpart of Database for use from the event loop.
+
+    Queries never block the loop, so DB writes overlap with the scanner's
+    RPC waits. The scan loop opens one when DATABASE_URL is set. Build with
+    `await AsyncDatabase.create()`.
+
+    Opportunities passed to queue_opportunity are written by a background
+    flusher in batches of up to batch_size rows, or whatever arrived within
+    flush_interval seconds of the first queued row.
+    """
+
+    def __init__(self, pool, batch_size=500, flush_interval=0.05):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = asyncio.Queue()
+        self._flusher_task = None
+
+    @classmethod
+    async def create(cls, dsn=None, min_size=2, max_size=10):
+        """Open the connection pool and create the schema"""
+        import asyncpg
+
+        pool = await asyncpg.create_pool(
+            dsn or config.DATABASE_URL,
+            min_size=min_size,
+            max_size=max_size
+        )
+        db = cls(pool)
+        await db.create_tables()
+        return db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def close(self):
+        """Flush queued opportunities and close the connection pool"""
+        if self._flusher_task is not None:
+            await self.flush()
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        await self.pool.close()
+
+    async def queue_opportunity(self, opp):
+        """Queue an opportunity for the next batched insert"""
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._flusher())
+        await self._queue.put(opp)
+
+    async def flush(self):
+        """Wait until every queued opportunity has been written"""
+        await self._queue.join()
+
+    async def _flusher(self):
+        """Drain the queue into batched inserts, one transaction per batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.insert_opportunities_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to insert {len(batch)} queued opportunities: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def create_tables(self):
+        """Create database schema"""
+        async with self.pool.acquire() as conn:
+            for statement in SCHEMA_STATEMENTS:
+                await conn.execute(statement)
+
+    async def insert_opportunity(self, opp):
+        """Insert opportunity into database"""
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.execute(ASYNC_COMMIT_SQL)
+            return await conn.fetchval(INSERT_OPPORTUNITY_SQL, *_opportunity_row(opp))
+
+    async def insert_opportunities_batch(self, opps):
+        """Insert many opportunities in a single round trip.
+
+        Returns the new row ids in the same order as opps.
+        """
+        if not opps:
+            return []
+
+        columns = [list(values) for values in zip(*map(_opportunity_row, opps))]
+        async with self.pool.acquire() as conn, conn.transaction():
+            await conn.execute(ASYNC_COMMIT_SQL)
+            records = await conn.fetch(INSERT_OPPORTUNITIES_UNNEST_SQL, *columns)
+        return [record['id'] for record in records]
+
+    async def get_unexecuted_opportunities(self):
+        """Get all unexecuted profitable opportunities as asyncpg Records"""
+        async with self.pool.acquire() as conn:
+            return await conn.fetch(SELECT_UNEXECUTED_SQL, config.PROFIT_THRESHOLD * 100)
+
 
 if __name__ == "__main__":
     db = Database()
@@ -21,13 +21,17 @@ Security Features:
 """
 
 import asyncio
+from eth_abi import decode, encode
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import Web3Exception, ContractLogicError
 from eth_account import Account
-from typing import Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
 import json
+import time
 from pathlib import Path
 
 from config.logging_config import get_logger
@@ -36,10 +40,34 @@ from utils.slippage_calculator import SlippageCalculator
 from utils.gas_price import GasPriceFetcher, ETHPriceFetcher
 from utils.notifications import NotificationManager
 from utils.private_mempool import PrivateMempoolManager
+from utils.addresses import checksum_address
 
 logger = get_logger(__name__)
 
 
+# FlashloanArbitrage.ArbitrageParams, shared by both contract entry points
+_ARBITRAGE_PARAMS_INPUT = {
+    "components": [
+        {"internalType": "address", "name": "tokenBorrow", "type": "address"},
+        {"internalType": "uint256", "name": "amount", "type": "uint256"},
+        {"internalType": "address", "name": "tokenTarget", "type": "address"},
+        {"internalType": "address", "name": "buyDex", "type": "address"},
+        {"internalType": "address", "name": "sellDex", "type": "address"},
+        {"internalType": "address[]", "name": "buyPath", "type": "address[]"},
+        {"internalType": "address[]", "name": "sellPath", "type": "address[]"},
+        {"internalType": "uint256", "name": "minProfit", "type": "uint256"},
+        {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        {"internalType": "uint256", "name": "slippageBps", "type": "uint256"}
+    ],
+    "internalType": "struct FlashloanArbitrage.ArbitrageParams",
+    "name": "params",
+    "type": "tuple"
+}
+
+# ABI type of the ArbitrageParams tuple, e.g. "(address,uint256,...)"
+_ARBITRAGE_PARAMS_TYPE = '(' + ','.join(c['type'] for c in _ARBITRAGE_PARAMS_INPUT['components']) + ')'
+
+
 class ExecutionError(Exception):
     """Base exception for execution errors."""
     pass
@@ -86,8 +114,9 @@ class CircuitBreaker:
         self.time_window = time_window_seconds
         self.cooldown = cooldown_seconds
 
-        self.failures: list[datetime] = []
-        self.tripped_at: Optional[datetime] = None
+        # time.monotonic() timestamps: cheap floats, immune to wall-clock jumps
+        self.failures: deque[float] = deque()
+        self.tripped_at: Optional[float] = None
 
         logger.info(
             f"CircuitBreaker initialized: {max_failures} failures per {time_window_seconds}s, "
@@ -96,12 +125,13 @@ class CircuitBreaker:
 
     def record_failure(self, reason: str) -> None:
         """Record a failure."""
-        now = datetime.now()
+        now = time.monotonic()
         self.failures.append(now)
 
-        # Clean old failures outside time window
-        cutoff = now - timedelta(seconds=self.time_window)
-        self.failures = [f for f in self.failures if f > cutoff]
+        # Clean old failures outside time window (oldest are on the left)
+        cutoff = now - self.time_window
+        while self.failures and self.failures[0] <= cutoff:
+            self.failures.popleft()
 
         logger.warning(
             f"Circuit breaker failure recorded: {reason} "
@@ -130,7 +160,7 @@ class CircuitBreaker:
             return False
 
         # Check if cooldown period has passed
-        elapsed = (datetime.now() - self.tripped_at).total_seconds()
+        elapsed = time.monotonic() - self.tripped_at
         if elapsed >= self.cooldown:
             logger.info(f"Circuit breaker cooldown complete ({elapsed:.0f}s), resetting")
             self.tripped_at = None
@@ -141,8 +171,8 @@ class CircuitBreaker:
 
     def get_status(self) -> Dict:
         """Get current circuit breaker status."""
-        if self.tripped_at:
-            elapsed = (datetime.now() - self.tripped_at).total_seconds()
+        if self.tripped_at is not None:
+            elapsed = time.monotonic() - self.tripped_at
             remaining = max(0, self.cooldown - elapsed)
             return {
                 'status': 'tripped',
@@ -170,59 +200,29 @@ class ArbitrageExecutor:
     6. Handle results
     """
 
+    # Fields every opportunity from the scanner must carry
+    REQUIRED_FIELDS = frozenset({
+        'token_in', 'token_out', 'buy_dex', 'sell_dex',
+        'amount', 'profit_pct', 'profit_usd'
+    })
+
     # Flashloan contract ABI (updated for multi-hop support)
-    FLASHLOAN_ABI = json.loads('''[
+    FLASHLOAN_ABI = [
         {
-            "inputs": [
-                {
-                    "components": [
-                        {"internalType": "address", "name": "tokenBorrow", "type": "address"},
-                        {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                        {"internalType": "address", "name": "tokenTarget", "type": "address"},
-                        {"internalType": "address", "name": "buyDex", "type": "address"},
-                        {"internalType": "address", "name": "sellDex", "type": "address"},
-                        {"internalType": "address[]", "name": "buyPath", "type": "address[]"},
-                        {"internalType": "address[]", "name": "sellPath", "type": "address[]"},
-                        {"internalType": "uint256", "name": "minProfit", "type": "uint256"},
-                        {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                        {"internalType": "uint256", "name": "slippageBps", "type": "uint256"}
-                    ],
-                    "internalType": "struct FlashloanArbitrage.ArbitrageParams",
-                    "name": "params",
-                    "type": "tuple"
-                }
-            ],
+            "inputs": [_ARBITRAGE_PARAMS_INPUT],
             "name": "executeArbitrage",
             "outputs": [],
             "stateMutability": "nonpayable",
             "type": "function"
         },
         {
-            "inputs": [
-                {
-                    "components": [
-                        {"internalType": "address", "name": "tokenBorrow", "type": "address"},
-                        {"internalType": "uint256", "name": "amount", "type": "uint256"},
-                        {"internalType": "address", "name": "tokenTarget", "type": "address"},
-                        {"internalType": "address", "name": "buyDex", "type": "address"},
-                        {"internalType": "address", "name": "sellDex", "type": "address"},
-                        {"internalType": "address[]", "name": "buyPath", "type": "address[]"},
-                        {"internalType": "address[]", "name": "sellPath", "type": "address[]"},
-                        {"internalType": "uint256", "name": "minProfit", "type": "uint256"},
-                        {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                        {"internalType": "uint256", "name": "slippageBps", "type": "uint256"}
-                    ],
-                    "internalType": "struct FlashloanArbitrage.ArbitrageParams",
-                    "name": "params",
-                    "type": "tuple"
-                }
-            ],
+            "inputs": [_ARBITRAGE_PARAMS_INPUT],
             "name": "simulateArbitrage",
             "outputs": [{"internalType": "uint256", "name": "expectedProfit", "type": "uint256"}],
             "stateMutability": "view",
             "type": "function"
         }
-    ]''')
+    ]
 
     def __init__(
         self,
@@ -257,6 +257,10 @@ class ArbitrageExecutor:
             abi=self.FLASHLOAN_ABI
         )
 
+        # simulateArbitrage is called for every opportunity; encode it by hand
+        # and issue a raw eth_call instead of going through ContractFunction
+        self._sim_selector = bytes(Web3.keccak(text=f"simulateArbitrage({_ARBITRAGE_PARAMS_TYPE})")[:4])
+
         # Initialize account (if not dry run)
         if not dry_run:
             self.private_key = private_key or config.PRIVATE_KEY
@@ -283,6 +287,26 @@ class ArbitrageExecutor:
         self.dexes = {d['name']: d for d in data['scroll']['dexes']}
         self.tokens = {t['symbol']: t for t in data['scroll']['common_tokens']}
 
+        # Checksums and decimal scales are constant; compute them once here
+        # instead of on every simulation
+        for dex in self.dexes.values():
+            dex['router_cs'] = checksum_address(dex['router'])
+        for token in self.tokens.values():
+            token['address_cs'] = checksum_address(token['address'])
+            token['decimals_pow'] = 10 ** token['decimals']
+
+        # Config-derived constants used on every evaluation
+        self._profit_threshold_pct = config.PROFIT_THRESHOLD * 100
+        self._max_slippage_pct = config.SLIPPAGE_TOLERANCE * 100
+        self._slippage_bps = int(config.SLIPPAGE_TOLERANCE * 10000)
+        self._min_profit_factor = Decimal('0.8')  # Require 80% of expected profit
+
+        # Bounds how many opportunities are evaluated at once in
+        # evaluate_and_execute_many; live sends are serialized so concurrent
+        # evaluations never race on the account nonce
+        self._eval_semaphore = asyncio.Semaphore(config.EVAL_CONCURRENCY)
+        self._send_lock = asyncio.Lock()
+
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker(
             max_failures=5,
@@ -304,6 +328,10 @@ class ArbitrageExecutor:
         else:
             self.private_mempool = None
 
+        # Bind the per-mode code paths once instead of branching per opportunity
+        self._execute_fn = self._simulated_result if dry_run else self._execute_serialized
+        self._send_tx = self._send_private if self.private_mempool else self._send_public
+
         # Execution statistics
         self.stats = {
             'total_opportunities_evaluated': 0,
@@ -317,6 +345,17 @@ class ArbitrageExecutor:
 
         logger.info("ArbitrageExecutor initialized")
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def close(self):
+        """Release network resources (notification HTTP sessions)"""
+        await self.notifier.close()
+
     async def evaluate_and_execute(
         self,
         opportunity: Dict
@@ -364,17 +403,8 @@ class ArbitrageExecutor:
                 f"(${simulated_profit['profit_usd']:.2f})"
             )
 
-            # Execute (if not dry run)
-            if self.dry_run:
-                logger.info("DRY RUN: Would execute arbitrage here")
-                result = {
-                    'status': 'simulated',
-                    'opportunity': opportunity,
-                    'simulated_profit': simulated_profit,
-                    'timestamp': datetime.now().isoformat()
-                }
-            else:
-                result = await self._execute_arbitrage(opportunity, simulated_profit)
+            # Execute (dry run: build a simulated result instead)
+            result = await self._execute_fn(opportunity, simulated_profit)
 
             self.stats['passed_validation'] += 1
             return result
@@ -394,6 +424,29 @@ class ArbitrageExecutor:
 
             return None
 
+    async def evaluate_and_execute_many(
+        self,
+        opportunities: List[Dict]
+    ) -> List[Optional[Dict]]:
+        """
+        Evaluate a batch of opportunities concurrently.
+
+        Slippage checks and simulation run their RPC calls in worker threads,
+        so up to EVAL_CONCURRENCY opportunities overlap their waits. Circuit breaker
+        updates happen on the event loop thread and need no extra locking.
+
+        Args:
+            opportunities: Opportunity dicts from scanner
+
+        Returns:
+            Results in the same order as opportunities (None if not executed)
+        """
+        async def bounded(opportunity: Dict) -> Optional[Dict]:
+            async with self._eval_semaphore:
+                return await self.evaluate_and_execute(opportunity)
+
+        return await asyncio.gather(*(bounded(o) for o in opportunities))
+
     def _validate_opportunity(self, opp: Dict) -> None:
         """
         Validate opportunity before execution.
@@ -402,32 +455,30 @@ class ArbitrageExecutor:
             ValueError: If opportunity is invalid
             InsufficientProfitError: If profit is too low
         """
-        required_fields = [
-            'token_in', 'token_out', 'buy_dex', 'sell_dex',
-            'amount', 'profit_pct', 'profit_usd'
-        ]
-
-        for field in required_fields:
-            if field not in opp:
-                raise ValueError(f"Missing required field: {field}")
+        # One C-level set difference instead of a membership test per field
+        missing = self.REQUIRED_FIELDS - opp.keys()
+        if missing:
+            raise ValueError(f"Missing required field: {', '.join(sorted(missing))}")
 
         # Check profit threshold
-        if opp['profit_pct'] < (config.PROFIT_THRESHOLD * 100):
+        if opp['profit_pct'] < self._profit_threshold_pct:
             raise InsufficientProfitError(
                 f"Profit {opp['profit_pct']:.3f}% below threshold "
-                f"{config.PROFIT_THRESHOLD * 100:.3f}%"
+                f"{self._profit_threshold_pct:.3f}%"
             )
 
         # Check tokens exist in config
-        if opp['token_in'] not in self.tokens:
+        tokens = self.tokens
+        if opp['token_in'] not in tokens:
             raise ValueError(f"Unknown token: {opp['token_in']}")
-        if opp['token_out'] not in self.tokens:
+        if opp['token_out'] not in tokens:
             raise ValueError(f"Unknown token: {opp['token_out']}")
 
         # Check DEXes exist in config
-        if opp['buy_dex'] not in self.dexes:
+        dexes = self.dexes
+        if opp['buy_dex'] not in dexes:
             raise ValueError(f"Unknown DEX: {opp['buy_dex']}")
-        if opp['sell_dex'] not in self.dexes:
+        if opp['sell_dex'] not in dexes:
             raise ValueError(f"Unknown DEX: {opp['sell_dex']}")
 
         logger.debug("Opportunity validation passed")
@@ -442,26 +493,28 @@ class ArbitrageExecutor:
         token_in = self.tokens[opp['token_in']]
         token_out = self.tokens[opp['token_out']]
 
-        # Validate slippage on both legs
-        is_valid, slippage_info = self.slippage_calc.validate_arbitrage_slippage(
+        # Validate slippage on both legs. The calculator makes blocking RPC
+        # calls, so run it in a worker thread to keep the event loop free.
+        is_valid, slippage_info = await asyncio.to_thread(
+            self.slippage_calc.validate_arbitrage_slippage,
             buy_dex=opp['buy_dex'],
             sell_dex=opp['sell_dex'],
             token_in=token_in,
             token_out=token_out,
             amount=opp['amount'],
-            max_slippage_pct=config.SLIPPAGE_TOLERANCE * 100
+            max_slippage_pct=self._max_slippage_pct
         )
 
         if not is_valid:
             total_slippage = slippage_info.get('total_slippage_pct', 0)
             raise SlippageExceededError(
                 f"Total slippage {total_slippage:.3f}% exceeds maximum "
-                f"{config.SLIPPAGE_TOLERANCE * 100:.3f}%"
+                f"{self._max_slippage_pct:.3f}%"
             )
 
         logger.debug(
             f"Slippage check passed: {slippage_info.get('total_slippage_pct', 0):.3f}% "
-            f"(max: {config.SLIPPAGE_TOLERANCE * 100:.3f}%)"
+            f"(max: {self._max_slippage_pct:.3f}%)"
         )
 
     async def _simulate_execution(self, opp: Dict) -> Dict:
@@ -478,24 +531,25 @@ class ArbitrageExecutor:
             # Prepare parameters
             token_in = self.tokens[opp['token_in']]
             token_out = self.tokens[opp['token_out']]
-            buy_dex_router = Web3.to_checksum_address(self.dexes[opp['buy_dex']]['router'])
-            sell_dex_router = Web3.to_checksum_address(self.dexes[opp['sell_dex']]['router'])
+            buy_dex_router = self.dexes[opp['buy_dex']]['router_cs']
+            sell_dex_router = self.dexes[opp['sell_dex']]['router_cs']
+            decimals_pow = token_in['decimals_pow']
 
-            amount_wei = int(opp['amount'] * (10 ** token_in['decimals']))
+            # Decimal(str(x)) keeps the amount exactly as displayed; float
+            # multiplication by 10**18 would drift by a few wei
+            amount = Decimal(str(opp['amount']))
+            amount_wei = int(amount * decimals_pow)
 
             # Calculate minimum profit (80% of expected profit for safety)
-            expected_profit_tokens = (opp['profit_pct'] / 100) * opp['amount']
-            min_profit_tokens = expected_profit_tokens * 0.8
-            min_profit_wei = int(min_profit_tokens * (10 ** token_in['decimals']))
+            expected_profit_tokens = Decimal(str(opp['profit_pct'])) / 100 * amount
+            min_profit_tokens = expected_profit_tokens * self._min_profit_factor
+            min_profit_wei = int(min_profit_tokens * decimals_pow)
 
             # Deadline (5 minutes from now, using current time + buffer)
-            # Using time.time() is more reliable than block timestamp which could be stale
-            import time
+            # Using time.time() is more reliable than block timestamp which could be stale,
+            # and costs no RPC round trip
             deadline = int(time.time()) + 300  # Current timestamp + 5 minutes
 
-            # Slippage in basis points (from config)
-            slippage_bps = int(config.SLIPPAGE_TOLERANCE * 10000)
-
             # Build buy and sell paths for multi-hop support
             buy_route = opp.get('buy_route', [token_in['symbol'], token_out['symbol']])
             sell_route = opp.get('sell_route', [token_out['symbol'], token_in['symbol']])
@@ -508,7 +562,7 @@ class ArbitrageExecutor:
                 # Multi-hop buy route
                 for symbol in buy_route:
                     if symbol in self.tokens:
-                        buy_path.append(Web3.to_checksum_address(self.tokens[symbol]['address']))
+                        buy_path.append(self.tokens[symbol]['address_cs'])
                     else:
                         logger.warning(f"Unknown token in buy route: {symbol}")
                         buy_path = []  # Fall back to empty (direct swap)
@@ -518,24 +572,26 @@ class ArbitrageExecutor:
                 # Multi-hop sell route
                 for symbol in sell_route:
                     if symbol in self.tokens:
-                        sell_path.append(Web3.to_checksum_address(self.tokens[symbol]['address']))
+                        sell_path.append(self.tokens[symbol]['address_cs'])
                     else:
                         logger.warning(f"Unknown token in sell route: {symbol}")
                         sell_path = []  # Fall back to empty (direct swap)
                         break
 
-            params = {
-                'tokenBorrow': Web3.to_checksum_address(token_in['address']),
-                'amount': amount_wei,
-                'tokenTarget': Web3.to_checksum_address(token_out['address']),
-                'buyDex': buy_dex_router,
-                'sellDex': sell_dex_router,
-                'buyPath': buy_path,  # Empty array for direct swap, populated for multi-hop
-                'sellPath': sell_path,  # Empty array for direct swap, populated for multi-hop
-                'minProfit': min_profit_wei,
-                'deadline': deadline,
-                'slippageBps': slippage_bps
-            }
+            # ArbitrageParams as a positional tuple in ABI order; it is
+            # encoded as-is, with no per-call dict building or key lookups
+            params = (
+                token_in['address_cs'],  # tokenBorrow
+                amount_wei,  # amount
+                token_out['address_cs'],  # tokenTarget
+                buy_dex_router,  # buyDex
+                sell_dex_router,  # sellDex
+                buy_path,  # buyPath: empty for direct swap, populated for multi-hop
+                sell_path,  # sellPath: empty for direct swap, populated for multi-hop
+                min_profit_wei,  # minProfit
+                deadline,  # deadline
+                self._slippage_bps  # slippageBps
+            )
 
             logger.debug(
                 f"Simulation params: buy_route={buy_route} ({len(buy_path)} addresses), "
@@ -545,13 +601,16 @@ class ArbitrageExecutor:
             # Call simulateArbitrage view function
             logger.debug(f"Simulating arbitrage with params: {params}")
 
-            expected_profit_wei = self.contract.functions.simulateArbitrage(params).call()
+            # Both are blocking RPC calls; run them in worker threads, side by
+            # side, so concurrent evaluations overlap their waits instead of
+            # stalling the event loop
+            expected_profit_wei, eth_price = await asyncio.gather(
+                asyncio.to_thread(self._call_simulate, params),
+                asyncio.to_thread(self.eth_price_fetcher.get_eth_price_usd)
+            )
 
             # Convert to human-readable
-            expected_profit_tokens = expected_profit_wei / (10 ** token_in['decimals'])
-
-            # Get ETH price for USD conversion
-            eth_price = self.eth_price_fetcher.get_eth_price_usd()
+            expected_profit_tokens = expected_profit_wei / decimals_pow
 
             # Convert to USD (if possible)
             if token_in['symbol'] in ['USDC', 'USDT']:
@@ -565,6 +624,7 @@ class ArbitrageExecutor:
                 'profit_tokens': expected_profit_tokens,
                 'profit_usd': expected_profit_usd,
                 'profit_wei': expected_profit_wei,
+                'eth_price_usd': eth_price,
                 'params': params
             }
 
@@ -573,6 +633,75 @@ class ArbitrageExecutor:
         except Exception as e:
             raise ExecutionError(f"Simulation failed: {e}")
 
+    def _call_simulate(self, params: Tuple) -> int:
+        """
+        Call simulateArbitrage with a pre-built selector and raw eth_call.
+
+        Args:
+            params: ArbitrageParams tuple, in ABI field order
+
+        Returns:
+            Expected profit in wei
+        """
+        encoded = encode([_ARBITRAGE_PARAMS_TYPE], [params])
+        raw = self.w3.eth.call({
+            'to': self.contract_address,
+            'data': self._sim_selector + encoded
+        })
+        return decode(['uint256'], raw)[0]
+
+    async def _simulated_result(self, opp: Dict, simulated_profit: Dict) -> Dict:
+        """Build the dry-run result in place of an on-chain execution."""
+        logger.info("DRY RUN: Would execute arbitrage here")
+        return {
+            'status': 'simulated',
+            'opportunity': opp,
+            'simulated_profit': simulated_profit,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    async def _execute_serialized(self, opp: Dict, simulated_profit: Dict) -> Dict:
+        """
+        Execute on-chain, one transaction at a time so nonces never collide.
+
+        Sends queued behind the lock passed the circuit breaker check before
+        the one ahead of them ran, so it is checked again once the lock is
+        held; a failed send must stop the rest of the queue.
+        """
+        async with self._send_lock:
+            if self.circuit_breaker.is_tripped():
+                logger.warning("Circuit breaker tripped while waiting to send, dropping queued execution")
+                raise CircuitBreakerTrippedError("Circuit breaker is tripped")
+            return await self._execute_arbitrage(opp, simulated_profit)
+
+    async def _send_private(self, raw_tx: bytes) -> str:
+        """Send a signed transaction through the private mempool manager."""
+        # Calculate max block number (valid for next 5 blocks)
+        current_block = self.w3.eth.block_number
+        max_block_number = current_block + 5
+
+        tx_hash_hex = await self.private_mempool.send_transaction(
+            raw_tx,
+            max_block_number=max_block_number
+        )
+
+        if not tx_hash_hex:
+            raise ExecutionError("Failed to send transaction through any mempool provider")
+
+        logger.info(
+            f"Transaction sent via {self.private_mempool.get_active_provider()}: "
+            f"{tx_hash_hex}"
+        )
+        return tx_hash_hex
+
+    async def _send_public(self, raw_tx: bytes) -> str:
+        """Send a signed transaction directly to the RPC node."""
+        # Fallback to direct sending (should not reach here in non-dry-run mode)
+        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
+        tx_hash_hex = tx_hash.hex()
+        logger.info(f"Transaction sent: {tx_hash_hex}")
+        return tx_hash_hex
+
     async def _execute_arbitrage(
         self,
         opp: Dict,
@@ -613,34 +742,16 @@ class ArbitrageExecutor:
             # Sign transaction
             signed_tx = self.account.sign_transaction(tx)
 
-            # Send transaction through private mempool (if available)
-            if self.private_mempool:
-                # Calculate max block number (valid for next 5 blocks)
-                current_block = self.w3.eth.block_number
-                max_block_number = current_block + 5
-
-                tx_hash_hex = await self.private_mempool.send_transaction(
-                    signed_tx.rawTransaction,
-                    max_block_number=max_block_number
-                )
-
-                if not tx_hash_hex:
-                    raise ExecutionError("Failed to send transaction through any mempool provider")
-
-                logger.info(
-                    f"Transaction sent via {self.private_mempool.get_active_provider()}: "
-                    f"{tx_hash_hex}"
-                )
-            else:
-                # Fallback to direct sending (should not reach here in non-dry-run mode)
-                tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-                tx_hash_hex = tx_hash.hex()
-                logger.info(f"Transaction sent: {tx_hash_hex}")
+            # Send transaction (through private mempool, if available)
+            tx_hash_hex = await self._send_tx(signed_tx.rawTransaction)
 
-            # Wait for receipt
+            # Wait for receipt. The hex hash is accepted as-is; the wait polls
+            # for up to 5 minutes, so run it in a worker thread to keep the
+            # event loop (and other evaluations) running meanwhile.
             logger.info("Waiting for transaction confirmation...")
-            receipt = self.w3.eth.wait_for_transaction_receipt(
-                bytes.fromhex(tx_hash_hex.replace('0x', '')),
+            receipt = await asyncio.to_thread(
+                self.w3.eth.wait_for_transaction_receipt,
+                tx_hash_hex,
                 timeout=300
             )
 
@@ -654,7 +765,11 @@ class ArbitrageExecutor:
                 self.stats['total_profit_usd'] += simulated_profit['profit_usd']
 
                 gas_cost_eth = receipt['gasUsed'] * (tx['gasPrice'] / 1e18)
-                gas_cost_usd = gas_cost_eth * self.eth_price_fetcher.get_eth_price_usd()
+                # Reuse the price from simulation. It was read before the
+                # receipt wait (up to 300s) and the fetcher caches for up to
+                # 300s, so it can be several minutes old; close enough for
+                # gas accounting stats, but not a live quote
+                gas_cost_usd = gas_cost_eth * simulated_profit['eth_price_usd']
                 self.stats['total_gas_spent_usd'] += gas_cost_usd
 
                 result = {
@@ -12,27 +12,104 @@ Fixes implemented:
 
 import asyncio
 import json
+import logging
 import os
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import requests
+import websockets
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from datetime import datetime
 from colorama import Fore, Style, init
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config.config import config
-from config.logging_config import setup_logging, get_logger
+from config.logging_config import CONSOLE_LOGGER_NAME, setup_logging, get_logger
 from src.concentrated_liquidity import ConcentratedLiquidityManager
+from src.database import AsyncDatabase
 from utils.gas_price import GasPriceFetcher, ETHPriceFetcher
 from utils.routing import MultiHopRouter, RouteOptimizer
+from utils.addresses import checksum_address
+from utils.multicall import Multicall, decode_results
 
 # Initialize colorama and logging
 init(autoreset=True)
 setup_logging(log_level="INFO" if not config.DEBUG_MODE else "DEBUG")
 logger = get_logger(__name__)
 
+# Uniswap V2 Router ABI (minimal)
+ROUTER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"}
+        ],
+        "name": "getAmountsOut",
+        "outputs": [{"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# getAmountsOut(uint256,address[])
+GET_AMOUNTS_OUT_SELECTOR = bytes.fromhex('d06ca61f')
+
+
+@lru_cache(maxsize=1024)
+def _amounts_out_template(*path: str) -> bytes:
+    """
+    ABI-encoded getAmountsOut calldata for a token path, with amountIn zeroed.
+
+    The path is the only dynamic argument and is fixed per route, so the
+    encoding is done once and callers only splice amountIn into bytes 4..36.
+    Layout: selector | amountIn | path offset (0x40) | path length | path addresses
+
+    Args:
+        *path: Checksummed token addresses, input token first
+
+    Returns:
+        Calldata template
+    """
+    return b''.join((
+        GET_AMOUNTS_OUT_SELECTOR,
+        bytes(32),
+        (0x40).to_bytes(32, 'big'),
+        len(path).to_bytes(32, 'big'),
+        *(bytes(12) + bytes.fromhex(address[2:]) for address in path),
+    ))
+
+
+def _edge(dex: Dict, symbol_a: str, symbol_b: str) -> Tuple[str, str, str]:
+    """Direction-independent key for a token pair's pool on a DEX."""
+    if symbol_a > symbol_b:
+        symbol_a, symbol_b = symbol_b, symbol_a
+    return dex['name'], symbol_a, symbol_b
+
+
+# Colorized console output goes through the logging queue and is written by
+# its background listener thread, so terminal I/O never blocks the event loop
+_console = get_logger(CONSOLE_LOGGER_NAME)
+
+
+def _write_lines(lines: List[str]):
+    """
+    Queue a block of console lines for the background writer.
+
+    The block is emitted as one record, so it is written with a single write
+    and flush and never interleaves with other output.
+
+    Args:
+        lines: Lines to print, without trailing newlines
+    """
+    _console.info('\n'.join(lines))
+
 
 class GasEstimator:
     """
@@ -47,8 +124,10 @@ class GasEstimator:
 
     # Aave V3 flashloan fee (0.09%)
     AAVE_FLASHLOAN_FEE_BPS = 9  # 9 basis points = 0.09%
+    AAVE_FLASHLOAN_FEE = AAVE_FLASHLOAN_FEE_BPS / 10000.0  # 0.0009
 
     @classmethod
+    @lru_cache(maxsize=None)
     def estimate_arbitrage_gas(
         cls,
         buy_dex_type: str,
@@ -58,6 +137,9 @@ class GasEstimator:
         """
         Estimate gas for arbitrage operation.
 
+        Memoized: the result depends only on the two DEX types and the hop
+        count, so only a handful of distinct values are ever computed.
+
         Args:
             buy_dex_type: Type of buy DEX ('uniswap_v2' or 'concentrated')
             sell_dex_type: Type of sell DEX ('uniswap_v2' or 'concentrated')
@@ -92,24 +174,44 @@ class ScrollDEXScanner:
     def __init__(self):
         logger.info("Initializing ScrollDEXScanner...")
 
-        self.w3 = Web3(Web3.HTTPProvider(config.ACTIVE_RPC))
+        # A local node's IPC socket skips TCP/TLS/HTTP on every call
+        if config.LOCAL_IPC_PATH:
+            self.rpc_endpoint = config.LOCAL_IPC_PATH
+            self.w3 = Web3(Web3.IPCProvider(self.rpc_endpoint))
+        else:
+            self.rpc_endpoint = config.ACTIVE_RPC
+            # Quotes are only useful within a block or two; fail a stalled
+            # request quickly rather than holding up the whole scan pass
+            self.w3 = Web3(Web3.HTTPProvider(
+                self.rpc_endpoint,
+                request_kwargs={'timeout': 5},
+                session=self._rpc_session()
+            ))
 
         # Verify connection
         if not self.w3.is_connected():
-            logger.error(f"Failed to connect to RPC: {config.ACTIVE_RPC}")
-            raise ConnectionError(f"Cannot connect to RPC: {config.ACTIVE_RPC}")
+            logger.error(f"Failed to connect to RPC: {self.rpc_endpoint}")
+            raise ConnectionError(f"Cannot connect to RPC: {self.rpc_endpoint}")
+
+        logger.info(f"Connected to RPC: {self.rpc_endpoint}")
 
-        logger.info(f"Connected to RPC: {config.ACTIVE_RPC}")
+        # Shared, already-parsed ABI (kept as an attribute for existing callers)
+        self.router_abi = ROUTER_ABI
 
         self.load_dex_configs()
-        self.opportunities = []
-
-        # Uniswap V2 Router ABI (minimal)
-        self.router_abi = json.loads(
-            '[{"inputs":[{"internalType":"uint256","name":"amountIn","type":"uint256"},'
-            '{"internalType":"address[]","name":"path","type":"address[]"}],'
-            '"name":"getAmountsOut","outputs":[{"internalType":"uint256[]","name":"amounts",'
-            '"type":"uint256[]"}],"stateMutability":"view","type":"function"}]'
+
+        # Most recent opportunities only, so a long-running scan stays
+        # bounded in memory; opportunity_count keeps the lifetime total
+        self.opportunities = deque(maxlen=1000)
+        self.opportunity_count = 0
+
+        # Multicall3 batches every V2 quote of a scan pass into one eth_call
+        self.multicall = Multicall(self.w3)
+
+        # Runs the V2 batch and each CL DEX's batch side by side, so a scan
+        # pass waits for the slowest batch rather than the sum of them
+        self._quote_executor = ThreadPoolExecutor(
+            max_workers=1 + len(self.cl_dexes), thread_name_prefix='quote'
         )
 
         # Initialize concentrated liquidity manager
@@ -129,16 +231,81 @@ class ScrollDEXScanner:
         logger.info("Multi-hop router initialized")
 
         # Enable/disable multi-hop routing
-        self.enable_multi_hop = getattr(config, 'ENABLE_MULTI_HOP_ROUTING', True)
-        self.max_hops = getattr(config, 'MAX_ROUTING_HOPS', 2)  # 1 or 2 intermediary tokens
+        self.enable_multi_hop = config.ENABLE_MULTI_HOP_ROUTING
+        self.max_hops = config.MAX_ROUTING_HOPS  # 1 or 2 intermediary tokens
         logger.info(f"Multi-hop routing: {'enabled' if self.enable_multi_hop else 'disabled'} (max hops: {self.max_hops})")
 
-        # Cache for prices (to display in UI)
+        # Tokens and max_hops are fixed, so each pair's multi-hop routes
+        # (direct routes excluded; they're quoted separately) are too
+        self._routes_by_pair: Dict[Tuple[str, str], List[List[str]]] = {}
+        if self.enable_multi_hop:
+            for token_in in self.tokens:
+                for token_out in self.tokens:
+                    if token_in is token_out:
+                        continue
+                    pair = (token_in['symbol'], token_out['symbol'])
+                    self._routes_by_pair[pair] = [
+                        route for route in self.multi_hop_router.find_routes(*pair, max_hops=self.max_hops)
+                        if len(route) > 2
+                    ]
+
+        # Profit thresholds (config is immutable, so read once here rather
+        # than per arbitrage check)
+        self.profit_threshold_pct = config.PROFIT_THRESHOLD * 100
+        self.min_profit_usd = config.MIN_PROFIT_USD
+
+        # Prices refreshed by the scan loop, used for display and profit math
         self._cached_gas_price = 0.0
         self._cached_eth_price = 0.0
 
+        # Bounds the blocking quote calls running in worker threads at once,
+        # since every pair is scanned concurrently
+        self._rpc_semaphore = asyncio.Semaphore(config.MAX_INFLIGHT_RPC)
+
+        # (dex name, symbol in, symbol out, amount in) -> quoted output (None
+        # if the hop has no pool); cleared at the start of every scan pass so
+        # quotes never outlive the block they were read at
+        self._quote_cache: Dict[Tuple[str, str, str, float], Optional[float]] = {}
+
+        # Pools found missing this scan pass, as _edge() keys. Pool existence
+        # doesn't depend on amount or direction, so one miss prunes every
+        # route through that edge on that DEX.
+        self._missing_edges: Set[Tuple[str, str, str]] = set()
+
+        # Gas estimate -> USD cost; only valid until the next price refresh
+        self._gas_cost_cache: Dict[int, float] = {}
+
+        # Opportunity store, opened by run_continuous_scan when DATABASE_URL
+        # is set; opportunities recorded during a pass are queued after it
+        self.db: Optional[AsyncDatabase] = None
+        self._pass_opportunities: List[Dict] = []
+
         logger.info("ScrollDEXScanner initialization complete")
 
+    @staticmethod
+    def _rpc_session() -> requests.Session:
+        """
+        HTTP session for the RPC provider, sized for concurrent quoting.
+
+        requests keeps at most 10 idle connections per host by default; with
+        more quote threads than that, extra connections are closed after each
+        call and every later call pays a new TCP/TLS handshake. The pool holds
+        one connection per permitted in-flight quote, plus headroom for the
+        direct-quote batches and price refreshes that run outside that limit.
+
+        No transport-level retries are configured: web3's HTTPProvider
+        already retries failed requests in its own middleware, and stacking
+        urllib3 retries underneath would multiply the attempts per failure.
+
+        Returns:
+            Session with a keep-alive pool sized to MAX_INFLIGHT_RPC
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=config.MAX_INFLIGHT_RPC + 8)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def load_dex_configs(self):
         """Load DEX configurations from JSON file"""
         config_path = Path(__file__).parent.parent / 'config' / 'dex_configs.json'
@@ -147,11 +314,69 @@ class ScrollDEXScanner:
         with open(config_path, 'r') as f:
             data = json.load(f)
 
-        self.dexes = data['scroll']['dexes']
+        self.dexes = self._dedupe_v2_dexes(data['scroll']['dexes'])
         self.tokens = data['scroll']['common_tokens']
 
+        # Addresses and router contracts never change; checksum and build
+        # them once here rather than on every quote
+        quote_fns = {
+            'uniswap_v2': self.get_price,
+            'concentrated': self.get_concentrated_price,
+        }
+        for dex in self.dexes:
+            dex['router'] = checksum_address(dex['router'])
+            dex['_quote'] = quote_fns.get(dex['type'])
+            # Optional whitelist of token symbols the DEX has pools for;
+            # None means every token is assumed to be supported
+            supported = dex.get('supported_tokens')
+            dex['_supported'] = frozenset(supported) if supported is not None else None
+            if dex['type'] == 'uniswap_v2':
+                dex['_contract'] = self.w3.eth.contract(address=dex['router'], abi=self.router_abi)
+        for token in self.tokens:
+            token['address'] = checksum_address(token['address'])
+            token['_scale'] = 10 ** token['decimals']
+        self.tokens_by_symbol = {token['symbol']: token for token in self.tokens}
+
+        # DEXes partitioned by pricing model, so quoting loops don't re-check
+        # dex['type'] for every (pair, DEX) combination
+        self.v2_dexes = [dex for dex in self.dexes if dex['type'] == 'uniswap_v2']
+        self.cl_dexes = [dex for dex in self.dexes if dex['type'] == 'concentrated']
+
         logger.info(f"Loaded {len(self.dexes)} DEXes and {len(self.tokens)} tokens")
 
+    @staticmethod
+    def _dedupe_v2_dexes(dexes: List[Dict]) -> List[Dict]:
+        """
+        Drop V2 DEXes that share a factory with an earlier entry.
+
+        Routers on the same factory quote the same pools, so their prices are
+        identical and can never form an arbitrage; quoting them again only
+        costs RPC work. The entry with the best (lowest) priority is kept.
+
+        Args:
+            dexes: DEX configuration dicts
+
+        Returns:
+            DEX configs with duplicate V2 factories removed, in original order
+        """
+        kept = {}
+        for dex in sorted(dexes, key=lambda d: d.get('priority', 0)):
+            if dex['type'] != 'uniswap_v2' or 'factory' not in dex:
+                continue
+            factory = dex['factory'].lower()
+            if factory in kept:
+                logger.info(
+                    f"Skipping {dex['name']}: same factory as {kept[factory]['name']}"
+                )
+                continue
+            kept[factory] = dex
+
+        kept_names = {dex['name'] for dex in kept.values()}
+        return [
+            dex for dex in dexes
+            if dex['type'] != 'uniswap_v2' or 'factory' not in dex or dex['name'] in kept_names
+        ]
+
     def get_price(self, dex: Dict, token_in: Dict, token_out: Dict, amount_in: float) -> Optional[float]:
         """
         Get price from Uniswap V2 style DEX.
@@ -169,36 +394,155 @@ class ScrollDEXScanner:
             Amount of output token you receive (already accounting for fees), or None if error
         """
         try:
-            router = self.w3.eth.contract(
-                address=Web3.to_checksum_address(dex['router']),
-                abi=self.router_abi
-            )
-
-            path = [
-                Web3.to_checksum_address(token_in['address']),
-                Web3.to_checksum_address(token_out['address'])
-            ]
+            router = dex['_contract']
+            path = [token_in['address'], token_out['address']]
 
             # Convert amount to Wei based on token decimals
-            amount_in_wei = int(amount_in * (10 ** token_in['decimals']))
+            amount_in_wei = int(amount_in * token_in['_scale'])
 
             amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
             amount_out_wei = amounts[-1]
 
             # Convert back from Wei
-            amount_out = amount_out_wei / (10 ** token_out['decimals'])
+            amount_out = amount_out_wei / token_out['_scale']
 
-            logger.debug(
-                f"{dex['name']}: {amount_in} {token_in['symbol']} → "
-                f"{amount_out:.6f} {token_out['symbol']} (price includes {dex['fee']*100}% fee)"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{dex['name']}: {amount_in} {token_in['symbol']} → "
+                    f"{amount_out:.6f} {token_out['symbol']} (price includes {dex['fee']*100}% fee)"
+                )
 
             return amount_out
 
         except Exception as e:
-            logger.debug(f"Error getting price from {dex['name']}: {str(e)}")
+            logger.debug("Error getting price from %s: %s", dex['name'], e)
             return None
 
+    def get_prices(
+        self,
+        quotes: List[Tuple[Dict, Dict, Dict, float]]
+    ) -> List[Optional[float]]:
+        """
+        Get prices from Uniswap V2 style DEXes for many quotes in one Multicall3 round trip.
+
+        Args:
+            quotes: List of (dex, token_in, token_out, amount_in) tuples
+
+        Returns:
+            Output amounts in the same order as quotes (None where the quote failed)
+        """
+        return self.get_route_prices([
+            (dex, (token_in, token_out), amount_in)
+            for dex, token_in, token_out, amount_in in quotes
+        ])
+
+    def get_route_prices(
+        self,
+        quotes: List[Tuple[Dict, Tuple[Dict, ...], float]]
+    ) -> List[Optional[float]]:
+        """
+        Quote token paths on Uniswap V2 style DEXes in one Multicall3 round trip.
+
+        A V2 router prices a whole multi-hop path in a single getAmountsOut
+        call, so each route costs one batched call regardless of its length.
+
+        Args:
+            quotes: List of (dex, path, amount_in) tuples, where path is the
+                sequence of token dicts from input to output
+
+        Returns:
+            Final output amounts in the same order as quotes (None where the quote failed)
+        """
+        prices: List[Optional[float]] = [None] * len(quotes)
+        calls = []
+        call_index = []
+
+        for i, (dex, path, amount_in) in enumerate(quotes):
+            try:
+                template = _amounts_out_template(*(token['address'] for token in path))
+                amount_in_wei = int(amount_in * path[0]['_scale'])
+                calldata = template[:4] + amount_in_wei.to_bytes(32, 'big') + template[36:]
+            except Exception as e:
+                logger.debug("Error encoding quote for %s: %s", dex['name'], e)
+                continue
+
+            calls.append((dex['router'], calldata))
+            call_index.append(i)
+
+        if not calls:
+            return prices
+
+        try:
+            results = decode_results(self.multicall.try_aggregate(calls), ['uint256[]'])
+        except Exception as e:
+            logger.debug("Error getting batched prices: %s", e)
+            return prices
+
+        # Failed calls (no pair, reverted) decode to None and are skipped
+        for i, decoded in zip(call_index, results):
+            if decoded is None or not decoded[0]:
+                dex, path, _ = quotes[i]
+                if len(path) == 2:
+                    self._missing_edges.add(_edge(dex, path[0]['symbol'], path[1]['symbol']))
+                continue
+            token_out = quotes[i][1][-1]
+            prices[i] = decoded[0][-1] / token_out['_scale']
+
+        return prices
+
+    def fetch_direct_prices(
+        self,
+        pairs: List[Tuple[Dict, Dict]],
+        amount: float
+    ) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Quote every token pair on every DEX for one scan pass.
+
+        V2 DEXes are quoted in a single Multicall3 batch and each concentrated
+        liquidity DEX in one batch of its own, instead of one RPC call per
+        (pair, DEX). The batches run concurrently on the quote thread pool.
+
+        Args:
+            pairs: (token_in, token_out) tuples to quote
+            amount: Input amount for every quote
+
+        Returns:
+            Dict mapping (token_in symbol, token_out symbol) to {dex name: output amount}
+        """
+        direct_prices = {(a['symbol'], b['symbol']): {} for a, b in pairs}
+
+        v2_quotes = [
+            (dex, token_in, token_out, amount)
+            for token_in, token_out in pairs
+            for dex in self.v2_dexes
+        ]
+        cl_quotes = [(token_in, token_out, amount) for token_in, token_out in pairs]
+
+        # Each batch is a separate blocking eth_call; issue them all at once
+        v2_future = self._quote_executor.submit(self.get_prices, v2_quotes)
+        cl_futures = [
+            (dex, self._quote_executor.submit(self.cl_manager.batch_get_prices, dex['name'], cl_quotes))
+            for dex in self.cl_dexes
+        ]
+
+        for (dex, token_in, token_out, _), price in zip(v2_quotes, v2_future.result()):
+            if price:
+                direct_prices[(token_in['symbol'], token_out['symbol'])][dex['name']] = price
+
+        for dex, future in cl_futures:
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.debug("Error getting concentrated prices from %s: %s", dex['name'], e)
+                continue
+            for (token_in, token_out, _), price in zip(cl_quotes, results):
+                # Seed the hop cache: these are the first hops of many CL routes
+                self._quote_cache[(dex['name'], token_in['symbol'], token_out['symbol'], amount)] = price
+                if price:
+                    direct_prices[(token_in['symbol'], token_out['symbol'])][dex['name']] = price
+
+        return direct_prices
+
     def get_concentrated_price(
         self,
         dex: Dict,
@@ -225,7 +569,7 @@ class ScrollDEXScanner:
                 dex['name'], token_in, token_out, amount_in
             )
 
-            if price:
+            if price and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"{dex['name']} (CL): {amount_in} {token_in['symbol']} → "
                     f"{price:.6f} {token_out['symbol']}"
@@ -234,9 +578,22 @@ class ScrollDEXScanner:
             return price
 
         except Exception as e:
-            logger.debug(f"Error getting concentrated price from {dex['name']}: {str(e)}")
+            logger.debug("Error getting concentrated price from %s: %s", dex['name'], e)
             return None
 
+    @staticmethod
+    def _dex_supports_route(dex: Dict, route: List[str]) -> bool:
+        """Whether every token of route is in the DEX's supported_tokens whitelist (if any)."""
+        supported = dex['_supported']
+        return supported is None or supported.issuperset(route)
+
+    def _route_has_missing_edge(self, dex: Dict, route: List[str]) -> bool:
+        """Whether any hop of route is a pool already found missing on dex this scan pass."""
+        return any(
+            _edge(dex, route[i], route[i + 1]) in self._missing_edges
+            for i in range(len(route) - 1)
+        )
+
     def get_multi_hop_price(
         self,
         dex: Dict,
@@ -256,60 +613,79 @@ class ScrollDEXScanner:
         """
         current_amount = amount
 
+        # Give up before quoting anything if a hop is a known missing pool
+        if self._route_has_missing_edge(dex, route):
+            return None
+
         # Execute each hop in the route
         for i in range(len(route) - 1):
             token_in_symbol = route[i]
             token_out_symbol = route[i + 1]
 
             # Get token configs
-            if token_in_symbol not in self.tokens or token_out_symbol not in self.tokens:
-                logger.debug(f"Unknown token in route: {token_in_symbol} or {token_out_symbol}")
+            token_in = self.tokens_by_symbol.get(token_in_symbol)
+            token_out = self.tokens_by_symbol.get(token_out_symbol)
+            if token_in is None or token_out is None:
+                logger.debug("Unknown token in route: %s or %s", token_in_symbol, token_out_symbol)
                 return None
 
-            token_in = self.tokens[token_in_symbol]
-            token_out = self.tokens[token_out_symbol]
-
-            # Get price for this hop
-            if dex['type'] == 'uniswap_v2':
-                hop_output = self.get_price(dex, token_in, token_out, current_amount)
-            elif dex['type'] == 'concentrated':
-                hop_output = self.get_concentrated_price(dex, token_in, token_out, current_amount)
+            # Get price for this hop (quote function bound at config load).
+            # The same hop recurs across routes and pairs within a scan pass.
+            key = (dex['name'], token_in_symbol, token_out_symbol, current_amount)
+            if key in self._quote_cache:
+                hop_output = self._quote_cache[key]
             else:
-                logger.debug(f"Unknown DEX type: {dex['type']}")
-                return None
+                quote = dex['_quote']
+                if quote is None:
+                    logger.debug("Unknown DEX type: %s", dex['type'])
+                    return None
+                hop_output = quote(dex, token_in, token_out, current_amount)
+                self._quote_cache[key] = hop_output
 
             if hop_output is None:
                 # This hop doesn't exist, route is invalid
+                self._missing_edges.add(_edge(dex, token_in_symbol, token_out_symbol))
                 return None
 
             # Output of this hop becomes input for next hop
             current_amount = hop_output
 
-        logger.debug(
-            f"Multi-hop {' → '.join(route)} on {dex['name']}: "
-            f"{amount} → {current_amount:.6f}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Multi-hop {' → '.join(route)} on {dex['name']}: "
+                f"{amount} → {current_amount:.6f}"
+            )
 
         return current_amount
 
-    async def scan_pair(self, token_in: Dict, token_out: Dict, amount: float = 1.0):
+    async def scan_pair(
+        self,
+        token_in: Dict,
+        token_out: Dict,
+        amount: float = 1.0,
+        direct_prices: Optional[Dict[str, float]] = None
+    ):
         """
         Scan a token pair across all DEXes, including multi-hop routes.
 
         Checks both direct pairs and multi-hop routes through intermediaries.
+
+        Args:
+            token_in: Input token dict
+            token_out: Output token dict
+            amount: Input amount
+            direct_prices: Pre-fetched {dex name: output amount} for this pair
+                (from fetch_direct_prices); quoted here if not given
         """
         prices = {}
 
+        if direct_prices is None:
+            fetched = await self._quote_in_thread(self.fetch_direct_prices, [(token_in, token_out)], amount)
+            direct_prices = fetched[(token_in['symbol'], token_out['symbol'])]
+
         # Scan direct routes
         for dex in self.dexes:
-            price = None
-
-            if dex['type'] == 'uniswap_v2':
-                # Uniswap V2 style DEX
-                price = self.get_price(dex, token_in, token_out, amount)
-            elif dex['type'] == 'concentrated':
-                # Concentrated liquidity DEX (Ambient, iZiSwap, etc.)
-                price = self.get_concentrated_price(dex, token_in, token_out, amount)
+            price = direct_prices.get(dex['name'])
 
             if price:
                 prices[dex['name']] = {
@@ -334,6 +710,21 @@ class ScrollDEXScanner:
         if len(prices) >= 2:
             await self.find_arbitrage(token_in, token_out, prices, amount)
 
+    async def _quote_in_thread(self, fn, *args):
+        """
+        Run a blocking quote function in a worker thread, at most
+        MAX_INFLIGHT_RPC at a time.
+
+        Args:
+            fn: Blocking function making RPC calls
+            *args: Arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        async with self._rpc_semaphore:
+            return await asyncio.to_thread(fn, *args)
+
     async def _scan_multi_hop_routes(
         self,
         token_in: Dict,
@@ -348,43 +739,68 @@ class ScrollDEXScanner:
         """
         multi_hop_prices = {}
 
-        # Find possible routes
-        routes = self.multi_hop_router.find_routes(
-            token_in['symbol'],
-            token_out['symbol'],
-            max_hops=self.max_hops
-        )
+        # Multi-hop routes, precomputed at startup
+        routes = self._routes_by_pair.get((token_in['symbol'], token_out['symbol']), [])
 
-        # Filter out direct routes (already scanned)
-        routes = [r for r in routes if len(r) > 2]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Found {len(routes)} multi-hop routes for "
+                f"{token_in['symbol']}→{token_out['symbol']}"
+            )
 
-        logger.debug(
-            f"Found {len(routes)} multi-hop routes for "
-            f"{token_in['symbol']}→{token_out['symbol']}"
+        # V2 routers quote a whole path in one getAmountsOut call, so every
+        # V2 route goes into a single Multicall3 batch
+        v2_candidates = []
+        for route in routes:
+            path = tuple(self.tokens_by_symbol.get(symbol) for symbol in route)
+            if None in path:
+                logger.debug("Unknown token in route: %s", route)
+                continue
+            v2_candidates.extend(
+                (route, dex, path) for dex in self.v2_dexes
+                if self._dex_supports_route(dex, route)
+                and not self._route_has_missing_edge(dex, route)
+            )
+
+        # Concentrated liquidity routes are quoted hop by hop. Quotes are
+        # blocking RPC calls, so run them in worker threads and let them overlap.
+        cl_candidates = [
+            (route, dex) for route in routes for dex in self.cl_dexes
+            if self._dex_supports_route(dex, route)
+        ]
+
+        v2_prices, *cl_prices = await asyncio.gather(
+            self._quote_in_thread(
+                self.get_route_prices,
+                [(dex, path, amount) for _, dex, path in v2_candidates]
+            ),
+            *(
+                self._quote_in_thread(self.get_multi_hop_price, dex, route, amount)
+                for route, dex in cl_candidates
+            )
         )
 
-        # Try each route on each DEX
-        for route in routes:
-            for dex in self.dexes:
-                # Try to execute this route on this DEX
-                final_price = self.get_multi_hop_price(dex, route, amount)
-
-                if final_price:
-                    # Calculate number of hops (swaps)
-                    num_hops = len(route) - 1
-
-                    # Create unique key for this route+DEX combination
-                    route_key = f"{dex['name']}_{'_'.join(route)}"
-
-                    multi_hop_prices[route_key] = {
-                        'price': final_price,
-                        'router': dex['router'],
-                        'type': dex['type'],
-                        'fee': dex['fee'],
-                        'route': route,
-                        'num_hops': num_hops
-                    }
+        candidates = [(route, dex) for route, dex, _ in v2_candidates] + cl_candidates
+        final_prices = v2_prices + cl_prices
+
+        for (route, dex), final_price in zip(candidates, final_prices):
+            if final_price:
+                # Calculate number of hops (swaps)
+                num_hops = len(route) - 1
+
+                # Create unique key for this route+DEX combination
+                route_key = f"{dex['name']}_{'_'.join(route)}"
+
+                multi_hop_prices[route_key] = {
+                    'price': final_price,
+                    'router': dex['router'],
+                    'type': dex['type'],
+                    'fee': dex['fee'],
+                    'route': route,
+                    'num_hops': num_hops
+                }
 
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         f"Multi-hop route found: {' → '.join(route)} on {dex['name']}, "
                         f"output: {final_price:.6f}"
@@ -399,38 +815,82 @@ class ScrollDEXScanner:
         prices: Dict,
         amount: float
     ):
-        """Find profitable arbitrage opportunities"""
-        dex_names = list(prices.keys())
-
-        for i, dex1 in enumerate(dex_names):
-            for dex2 in dex_names[i+1:]:
-                price1 = prices[dex1]['price']
-                price2 = prices[dex2]['price']
-
-                # Check both directions for arbitrage
-                # Direction 1: Buy on dex1, sell on dex2
-                if price1 < price2:
-                    self._check_arbitrage_direction(
-                        token_in, token_out, dex1, dex2,
-                        price1, price2,
-                        prices[dex1]['type'], prices[dex2]['type'],
-                        prices[dex1].get('num_hops', 1), prices[dex2].get('num_hops', 1),
-                        prices[dex1].get('route', [token_in['symbol'], token_out['symbol']]),
-                        prices[dex2].get('route', [token_in['symbol'], token_out['symbol']]),
-                        amount
-                    )
+        """
+        Find the most profitable arbitrage opportunity for a pair.
+
+        The widest gross spread is not necessarily the best trade: gas
+        depends on DEX type and hop count, so a narrower direct edge can net
+        more than a wide multi-hop or CL one. Edges are walked from the
+        widest spread down and each is evaluated net of gas and fees; only
+        the one with the highest net USD profit is recorded.
+
+        The walk stops as soon as an edge's upper bound, its gross USD
+        spread minus the cheapest possible gas cost, cannot reach the dust
+        threshold or beat the best edge so far, so once an edge qualifies
+        the narrower ones behind it are skipped unevaluated.
+        """
+        eth_price_usd = self._cached_eth_price or self.eth_price_fetcher.get_eth_price_usd()
+        usd_per_token = self._usd_per_output_token(token_in, token_out, amount, eth_price_usd)
+        min_gas_cost_usd = self._gas_cost_usd(
+            GasEstimator.estimate_arbitrage_gas('uniswap_v2', 'uniswap_v2', num_hops=1),
+            eth_price_usd
+        )
 
-                # Direction 2: Buy on dex2, sell on dex1
-                elif price2 < price1:
-                    self._check_arbitrage_direction(
-                        token_in, token_out, dex2, dex1,
-                        price2, price1,
-                        prices[dex2]['type'], prices[dex1]['type'],
-                        prices[dex2].get('num_hops', 1), prices[dex1].get('num_hops', 1),
-                        prices[dex2].get('route', [token_in['symbol'], token_out['symbol']]),
-                        prices[dex1].get('route', [token_in['symbol'], token_out['symbol']]),
-                        amount
-                    )
+        def can_win(spread: float) -> bool:
+            bound = spread * usd_per_token - min_gas_cost_usd
+            return bound > best['profit_usd'] if best else bound >= self.min_profit_usd
+
+        # Quotes sorted by output: for each buy quote, sells are tried from
+        # the highest down, so spreads only shrink along both loops
+        ranked = sorted(prices.items(), key=lambda item: item[1]['price'])
+        top_price = ranked[-1][1]['price'] if ranked else 0.0
+        direct_route = [token_in['symbol'], token_out['symbol']]
+        best = None
+
+        for i, (buy_dex, buy) in enumerate(ranked):
+            # Widest spread any later buy quote could still reach
+            if not can_win(top_price - buy['price']):
+                break
+
+            for sell_dex, sell in reversed(ranked[i + 1:]):
+                if not can_win(sell['price'] - buy['price']):
+                    break
+
+                opportunity = self._check_arbitrage_direction(
+                    token_in, token_out, buy_dex, sell_dex,
+                    buy['price'], sell['price'],
+                    buy['type'], sell['type'],
+                    buy.get('num_hops', 1), sell.get('num_hops', 1),
+                    buy.get('route', direct_route),
+                    sell.get('route', direct_route),
+                    amount
+                )
+                if opportunity and (best is None or opportunity['profit_usd'] > best['profit_usd']):
+                    best = opportunity
+
+        if best is not None:
+            self._record_opportunity(best)
+
+    @staticmethod
+    def _usd_per_output_token(
+        token_in: Dict,
+        token_out: Dict,
+        amount: float,
+        eth_price_usd: float
+    ) -> float:
+        """
+        USD value of one unit of price spread, as _check_arbitrage_direction
+        converts gross profit (0 for pairs it cannot price).
+        """
+        if token_out['symbol'] in ('USDC', 'USDT'):
+            return amount
+        if token_out['symbol'] == 'WETH':
+            return amount * eth_price_usd
+        if token_in['symbol'] in ('USDC', 'USDT'):
+            return amount
+        if token_in['symbol'] == 'WETH':
+            return amount * eth_price_usd
+        return 0.0
 
     def _check_arbitrage_direction(
         self,
@@ -447,7 +907,7 @@ class ScrollDEXScanner:
         buy_route: List[str],
         sell_route: List[str],
         amount: float
-    ):
+    ) -> Optional[Dict]:
         """
         Check if arbitrage is profitable in a specific direction.
 
@@ -468,6 +928,10 @@ class ScrollDEXScanner:
             buy_route: Full route for buy (e.g., ['STONE', 'WETH', 'USDC'])
             sell_route: Full route for sell
             amount: Trade amount
+
+        Returns:
+            Opportunity dict if the direction clears the profit thresholds,
+            else None
         """
         # Calculate profit in output token terms
         # If we swap 'amount' of token_in:
@@ -475,9 +939,22 @@ class ScrollDEXScanner:
         # - Sell on dex2: get sell_price of token_out
         # Profit = sell_price - buy_price
 
+        # No spread means no profit whatever the costs; skip the USD math
+        if sell_price <= buy_price:
+            return None
+
         profit_tokens = sell_price - buy_price
         profit_pct = (profit_tokens / buy_price) * 100
 
+        # Unless the profit is converted through the ETH price (WETH legs
+        # below), the net % after gas and fees can only be lower than the raw
+        # spread, so a spread under the threshold can never qualify
+        eth_scaled = token_out['symbol'] == 'WETH' or (
+            token_in['symbol'] == 'WETH' and token_out['symbol'] not in ('USDC', 'USDT')
+        )
+        if not eth_scaled and profit_pct < self.profit_threshold_pct:
+            return None
+
         # FIX: Do NOT subtract fees again - prices already include fees!
         # Old buggy code: net_profit_pct = profit_pct - (total_fees * 100)
         net_profit_pct = profit_pct  # Prices already account for fees
@@ -487,18 +964,16 @@ class ScrollDEXScanner:
             buy_dex_type, sell_dex_type, num_hops=max(buy_num_hops, sell_num_hops)
         )
 
-        # Get real-time ETH price
-        eth_price_usd = self.eth_price_fetcher.get_eth_price_usd()
+        # ETH price refreshed by the scan loop (every 10 scans, with gas);
+        # fall back to the fetcher if no scan has run yet
+        eth_price_usd = self._cached_eth_price or self.eth_price_fetcher.get_eth_price_usd()
 
         # Calculate flashloan fee (0.09% on borrowed amount)
         # This applies to the input token (token_in)
-        flashloan_fee_pct = GasEstimator.AAVE_FLASHLOAN_FEE_BPS / 10000.0  # 0.0009
-        flashloan_fee_tokens = amount * flashloan_fee_pct
+        flashloan_fee_tokens = amount * GasEstimator.AAVE_FLASHLOAN_FEE
 
         # Calculate gas cost in USD
-        gas_cost_usd = self.gas_fetcher.estimate_transaction_cost_usd(
-            gas_estimate, eth_price_usd
-        )
+        gas_cost_usd = self._gas_cost_usd(gas_estimate, eth_price_usd)
 
         # Calculate profit in USD
         # For proper USD calculation, we need to know the USD value of the tokens
@@ -538,23 +1013,22 @@ class ScrollDEXScanner:
         net_profit_usd = gross_profit_usd - gas_cost_usd - flashloan_fee_usd
         net_profit_pct_after_gas = (net_profit_usd / (amount * buy_price)) * 100 if (amount * buy_price) > 0 else 0
 
-        logger.debug(
-            f"Arbitrage check: {token_in['symbol']}→{token_out['symbol']} "
-            f"buy={buy_dex}({buy_price:.6f}) sell={sell_dex}({sell_price:.6f}) "
-            f"profit={net_profit_pct:.3f}% gas_cost=${gas_cost_usd:.4f} "
-            f"flashloan_fee=${flashloan_fee_usd:.4f} "
-            f"net_profit=${net_profit_usd:.4f} ({net_profit_pct_after_gas:.3f}%)"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Arbitrage check: {token_in['symbol']}→{token_out['symbol']} "
+                f"buy={buy_dex}({buy_price:.6f}) sell={sell_dex}({sell_price:.6f}) "
+                f"profit={net_profit_pct:.3f}% gas_cost=${gas_cost_usd:.4f} "
+                f"flashloan_fee=${flashloan_fee_usd:.4f} "
+                f"net_profit=${net_profit_usd:.4f} ({net_profit_pct_after_gas:.3f}%)"
+            )
 
         # Check if profitable (percentage threshold AND dust threshold)
-        min_profit_usd = getattr(config, 'MIN_PROFIT_USD', 1.0)
-
-        if net_profit_pct_after_gas >= (config.PROFIT_THRESHOLD * 100) and net_profit_usd >= min_profit_usd:
+        if net_profit_pct_after_gas >= self.profit_threshold_pct and net_profit_usd >= self.min_profit_usd:
             # Check if this is a multi-hop route
             is_multi_hop = (len(buy_route) > 2) or (len(sell_route) > 2)
 
             opportunity = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp_ns': time.time_ns(),  # Formatted only when displayed
                 'token_in': token_in['symbol'],
                 'token_out': token_out['symbol'],
                 'buy_dex': buy_dex,
@@ -573,97 +1047,274 @@ class ScrollDEXScanner:
                 'buy_num_hops': buy_num_hops,
                 'sell_num_hops': sell_num_hops
             }
+            return opportunity
+
+        return None
+
+    def _record_opportunity(self, opportunity: Dict):
+        """Store, count and print an opportunity chosen by find_arbitrage"""
+        self.opportunities.append(opportunity)
+        self._pass_opportunities.append(opportunity)
+        self.opportunity_count += 1
+        self.log_opportunity(opportunity)
+
+        # Log with route information
+        is_multi_hop = opportunity['is_multi_hop']
+        buy_route_str = ' → '.join(opportunity['buy_route']) if is_multi_hop else opportunity['buy_dex']
+        sell_route_str = ' → '.join(opportunity['sell_route']) if is_multi_hop else opportunity['sell_dex']
+        logger.info(
+            f"OPPORTUNITY FOUND: {opportunity['token_in']}→{opportunity['token_out']} "
+            f"{buy_route_str} → {sell_route_str} "
+            f"profit={opportunity['profit_pct']}% (${opportunity['profit_usd']})"
+        )
 
-            self.opportunities.append(opportunity)
-            self.log_opportunity(opportunity)
+    def _gas_cost_usd(self, gas_estimate: int, eth_price_usd: float) -> float:
+        """
+        Gas cost in USD for a gas estimate, memoized between price refreshes.
 
-            # Log with route information
-            buy_route_str = ' → '.join(buy_route) if is_multi_hop else buy_dex
-            sell_route_str = ' → '.join(sell_route) if is_multi_hop else sell_dex
-            logger.info(
-                f"OPPORTUNITY FOUND: {opportunity['token_in']}→{opportunity['token_out']} "
-                f"{buy_route_str} → {sell_route_str} "
-                f"profit={opportunity['profit_pct']}% (${opportunity['profit_usd']})"
-            )
+        There are only a few distinct gas estimates (DEX type pair x hops),
+        and gas/ETH prices only change when the scan loop refreshes them, so
+        each cost is computed once per refresh instead of once per check.
+        Costs use the scan loop's gas price snapshot; the fetcher is only
+        consulted before the first refresh.
+
+        Raises:
+            ValueError: If eth_price_usd is not positive (a failed price
+                fetch must not make gas look free)
+        """
+        if eth_price_usd <= 0:
+            raise ValueError(f"Invalid eth_price_usd: {eth_price_usd}")
+
+        cost = self._gas_cost_cache.get(gas_estimate)
+        if cost is None:
+            if self._cached_gas_price:
+                # Same gas price snapshot as the ETH price; no fetcher call
+                cost = gas_estimate * self._cached_gas_price / 1e9 * eth_price_usd
+            else:
+                cost = self.gas_fetcher.estimate_transaction_cost_usd(gas_estimate, eth_price_usd)
+            self._gas_cost_cache[gas_estimate] = cost
+        return cost
 
     def log_opportunity(self, opp: Dict):
         """Log opportunity to console with colors"""
-        print(f"\n{Fore.GREEN}{'='*60}")
-        print(f"{Fore.YELLOW}🎯 ARBITRAGE OPPORTUNITY FOUND!")
-        print(f"{Fore.CYAN}Time: {opp['timestamp']}")
-        print(f"{Fore.WHITE}Pair: {opp['token_in']} → {opp['token_out']}")
+        lines = [
+            f"\n{Fore.GREEN}{'='*60}",
+            f"{Fore.YELLOW}🎯 ARBITRAGE OPPORTUNITY FOUND!",
+            f"{Fore.CYAN}Time: {datetime.fromtimestamp(opp['timestamp_ns'] / 1e9).isoformat(timespec='milliseconds')}",
+            f"{Fore.WHITE}Pair: {opp['token_in']} → {opp['token_out']}",
+        ]
 
         # Show multi-hop routes if applicable
         if opp.get('is_multi_hop', False):
             buy_route_str = ' → '.join(opp['buy_route'])
             sell_route_str = ' → '.join(opp['sell_route'])
-            print(f"{Fore.MAGENTA}Buy Route: {buy_route_str} ({opp['buy_num_hops']} hops)")
-            print(f"{Fore.MAGENTA}Sell Route: {sell_route_str} ({opp['sell_num_hops']} hops)")
-            print(f"{Fore.WHITE}Buy DEX: {opp['buy_dex']} @ {opp['buy_price']:.6f}")
-            print(f"{Fore.WHITE}Sell DEX: {opp['sell_dex']} @ {opp['sell_price']:.6f}")
+            lines += [
+                f"{Fore.MAGENTA}Buy Route: {buy_route_str} ({opp['buy_num_hops']} hops)",
+                f"{Fore.MAGENTA}Sell Route: {sell_route_str} ({opp['sell_num_hops']} hops)",
+                f"{Fore.WHITE}Buy DEX: {opp['buy_dex']} @ {opp['buy_price']:.6f}",
+                f"{Fore.WHITE}Sell DEX: {opp['sell_dex']} @ {opp['sell_price']:.6f}",
+            ]
         else:
             # Standard single-hop display
-            print(f"{Fore.WHITE}Buy on: {opp['buy_dex']} @ {opp['buy_price']:.6f}")
-            print(f"{Fore.WHITE}Sell on: {opp['sell_dex']} @ {opp['sell_price']:.6f}")
+            lines += [
+                f"{Fore.WHITE}Buy on: {opp['buy_dex']} @ {opp['buy_price']:.6f}",
+                f"{Fore.WHITE}Sell on: {opp['sell_dex']} @ {opp['sell_price']:.6f}",
+            ]
 
-        print(f"{Fore.GREEN}Profit: {opp['profit_pct']:.3f}% (${opp['profit_usd']})")
-        print(f"{Fore.CYAN}Gas Cost: ${opp['gas_cost_usd']:.4f} ({opp['gas_estimate']} gas)")
-        print(f"{Fore.CYAN}Flashloan Fee: ${opp.get('flashloan_fee_usd', 0):.4f} (0.09%)")
-        print(f"{Fore.GREEN}{'='*60}\n")
+        lines += [
+            f"{Fore.GREEN}Profit: {opp['profit_pct']:.3f}% (${opp['profit_usd']})",
+            f"{Fore.CYAN}Gas Cost: ${opp['gas_cost_usd']:.4f} ({opp['gas_estimate']} gas)",
+            f"{Fore.CYAN}Flashloan Fee: ${opp.get('flashloan_fee_usd', 0):.4f} (0.09%)",
+            f"{Fore.GREEN}{'='*60}\n",
+        ]
+        _write_lines(lines)
 
     async def run_continuous_scan(self):
         """Continuously scan for opportunities"""
         logger.info("Starting continuous scan...")
 
+        # asyncio.to_thread runs on the loop's default executor, which is
+        # sized from the CPU count and can be smaller than the RPC semaphore
+        # on small machines. Give it a worker for every in-flight quote plus
+        # headroom for the per-pass batch and price refreshes; threads are
+        # reused across passes.
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+            max_workers=config.MAX_INFLIGHT_RPC + 4, thread_name_prefix='rpc'
+        ))
+
         # Get initial gas price and ETH price for display
         self._cached_gas_price = self.gas_fetcher.get_gas_price_gwei()
         self._cached_eth_price = self.eth_price_fetcher.get_eth_price_usd()
 
-        print(f"{Fore.MAGENTA}{'='*60}")
-        print(f"{Fore.MAGENTA}🚀 Scroll Flashloan Arbitrage Scanner Started")
-        print(f"{Fore.MAGENTA}Network: {config.NETWORK_MODE.upper()}")
-        print(f"{Fore.MAGENTA}RPC: {config.ACTIVE_RPC}")
-        print(f"{Fore.MAGENTA}Scanning {len(self.dexes)} DEXes | {len(self.tokens)} tokens")
-        print(f"{Fore.MAGENTA}Profit Threshold: {config.PROFIT_THRESHOLD*100}%")
-        print(f"{Fore.CYAN}Gas Price: {self._cached_gas_price:.4f} gwei (dynamic)")
-        print(f"{Fore.CYAN}ETH Price: ${self._cached_eth_price:.2f}")
-        print(f"{Fore.MAGENTA}{'='*60}\n")
+        _write_lines([
+            f"{Fore.MAGENTA}{'='*60}",
+            f"{Fore.MAGENTA}🚀 Scroll Flashloan Arbitrage Scanner Started",
+            f"{Fore.MAGENTA}Network: {config.NETWORK_MODE.upper()}",
+            f"{Fore.MAGENTA}RPC: {self.rpc_endpoint}",
+            f"{Fore.MAGENTA}Scanning {len(self.dexes)} DEXes | {len(self.tokens)} tokens",
+            f"{Fore.MAGENTA}Profit Threshold: {config.PROFIT_THRESHOLD*100}%",
+            f"{Fore.CYAN}Gas Price: {self._cached_gas_price:.4f} gwei (dynamic)",
+            f"{Fore.CYAN}ETH Price: ${self._cached_eth_price:.2f}",
+            f"{Fore.MAGENTA}{'='*60}\n",
+        ])
+
+        # Every unordered token pair, in a fixed order. A token listed twice
+        # under different symbols would pair with itself; no pool exists for
+        # that, so don't spend quotes on it.
+        pairs = [
+            (token_in, token_out)
+            for i, token_in in enumerate(self.tokens)
+            for token_out in self.tokens[i+1:]
+            if token_in['address'] != token_out['address']
+        ]
+
+        # The database is optional: without one, opportunities are only
+        # logged
+        if config.DATABASE_URL:
+            try:
+                self.db = await AsyncDatabase.create()
+                logger.info("Opportunity database connected")
+            except Exception as e:
+                logger.warning(f"Database unavailable, opportunities will not be stored: {e}")
 
         scan_count = 0
-        while True:
-            scan_count += 1
+        try:
+            async for block_number in self._scan_ticks():
+                scan_count += 1
+
+                # Refresh gas/ETH prices every 10 scans (display and profit
+                # math), and on every scan while the ETH price is unusable
+                if scan_count % 10 == 1 or self._cached_eth_price <= 0:
+                    try:
+                        self._cached_gas_price, self._cached_eth_price = await asyncio.gather(
+                            asyncio.to_thread(self.gas_fetcher.get_gas_price_gwei),
+                            asyncio.to_thread(self.eth_price_fetcher.get_eth_price_usd)
+                        )
+                        self._gas_cost_cache.clear()
+                        _write_lines([
+                            f"{Fore.CYAN}[Price Update] Gas: {self._cached_gas_price:.4f} gwei | "
+                            f"ETH: ${self._cached_eth_price:.2f}"
+                        ])
+                    except Exception as e:
+                        logger.error(f"Failed to refresh prices: {e}")
+
+                # Every USD conversion (gas costs, WETH-leg profits) uses
+                # this price; without a usable one the pass can't price
+                # anything, so skip it
+                if self._cached_eth_price <= 0:
+                    logger.warning(
+                        f"No usable ETH price (${self._cached_eth_price}), skipping scan #{scan_count}"
+                    )
+                    continue
+
+                block_info = f" (block {block_number})" if block_number is not None else ""
+                _write_lines([f"{Fore.BLUE}[Scan #{scan_count}] {datetime.now().strftime('%H:%M:%S')}{block_info}"])
+
+                self._quote_cache.clear()
+                self._missing_edges.clear()
+                self._pass_opportunities.clear()
 
-            # Refresh gas/ETH prices every 10 scans (for display)
-            if scan_count % 10 == 1:
                 try:
-                    self._cached_gas_price = self.gas_fetcher.get_gas_price_gwei()
-                    self._cached_eth_price = self.eth_price_fetcher.get_eth_price_usd()
-                    print(
-                        f"{Fore.CYAN}[Price Update] Gas: {self._cached_gas_price:.4f} gwei | "
-                        f"ETH: ${self._cached_eth_price:.2f}"
-                    )
+                    # Quote all direct routes in batched calls (off the event
+                    # loop), then scan every pair concurrently
+                    direct_prices = await asyncio.to_thread(self.fetch_direct_prices, pairs, 1.0)
+                    await asyncio.gather(*(
+                        self.scan_pair(
+                            token_in, token_out, amount=1.0,
+                            direct_prices=direct_prices[(token_in['symbol'], token_out['symbol'])]
+                        )
+                        for token_in, token_out in pairs
+                    ))
+
+                    # Queued together, a pass's opportunities reach the
+                    # database as one batched insert, written in the
+                    # background while the next pass runs
+                    if self.db is not None:
+                        for opportunity in self._pass_opportunities:
+                            await self.db.queue_opportunity(opportunity)
+
+                    _write_lines([
+                        f"{Fore.WHITE}Scan complete. Total opportunities found: "
+                        f"{self.opportunity_count}"
+                    ])
+
                 except Exception as e:
-                    logger.error(f"Failed to refresh prices: {e}")
+                    logger.error(f"Error during scan: {e}", exc_info=True)
+        finally:
+            if self.db is not None:
+                await self.db.close()
+                self.db = None
 
-            print(f"{Fore.BLUE}[Scan #{scan_count}] {datetime.now().strftime('%H:%M:%S')}")
+    async def _scan_ticks(self):
+        """
+        Pace the scan loop.
 
+        With a WebSocket RPC configured, yields the block number of every new
+        head so each block is scanned once. Without one, or once the
+        subscription fails, yields None every 3 seconds.
+        """
+        if config.ACTIVE_WS:
             try:
-                # Scan all token pairs
-                for i, token_in in enumerate(self.tokens):
-                    for token_out in self.tokens[i+1:]:
-                        await self.scan_pair(token_in, token_out, amount=1.0)
-
-                print(
-                    f"{Fore.WHITE}Scan complete. Total opportunities found: "
-                    f"{len(self.opportunities)}"
-                )
-
+                async for block_number in self._new_heads():
+                    yield block_number
             except Exception as e:
-                logger.error(f"Error during scan: {e}", exc_info=True)
+                logger.warning(f"Block subscription failed, falling back to 3s polling: {e}")
 
-            # Wait before next scan
+        while True:
+            yield None
             await asyncio.sleep(3)  # Scan every 3 seconds
 
+    async def _new_heads(self):
+        """
+        Yield block numbers from an eth_subscribe newHeads subscription.
+
+        Heads that arrive while the consumer is busy are coalesced, so a slow
+        scan is followed by a scan of the newest block rather than a backlog
+        of stale ones.
+
+        Raises:
+            ConnectionError: If the subscription is rejected or the socket closes
+        """
+        async with websockets.connect(config.ACTIVE_WS) as ws:
+            await ws.send(json.dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'eth_subscribe',
+                'params': ['newHeads']
+            }))
+            reply = json.loads(await ws.recv())
+            if 'error' in reply:
+                raise ConnectionError(f"newHeads subscription rejected: {reply['error']}")
+            logger.info(f"Subscribed to new blocks via {config.ACTIVE_WS}")
+
+            latest = asyncio.Queue(maxsize=1)
+
+            async def read_heads():
+                try:
+                    async for message in ws:
+                        head = json.loads(message).get('params', {}).get('result')
+                        if not head:
+                            continue
+                        if latest.full():
+                            latest.get_nowait()
+                        latest.put_nowait(int(head['number'], 16))
+                finally:
+                    # None tells the consumer the stream has ended
+                    if latest.full():
+                        latest.get_nowait()
+                    latest.put_nowait(None)
+
+            reader = asyncio.create_task(read_heads())
+            try:
+                while True:
+                    block_number = await latest.get()
+                    if block_number is None:
+                        await reader  # Re-raises the reader's error, if any
+                        raise ConnectionError("newHeads subscription closed")
+                    yield block_number
+            finally:
+                reader.cancel()
+
 
 async def main():
     """Main entry point"""
@@ -672,11 +1323,29 @@ async def main():
         await scanner.run_continuous_scan()
     except KeyboardInterrupt:
         logger.info("Received shutdown signal")
-        print(f"\n{Fore.YELLOW}Shutting down gracefully...")
+        _write_lines([f"\n{Fore.YELLOW}Shutting down gracefully..."])
     except Exception as e:
         logger.error(f"Fatal error in main: {e}", exc_info=True)
         raise
 
 
+def run_event_loop(coro):
+    """
+    Run a coroutine to completion, on uvloop's libuv-based event loop when
+    it is installed (it isn't available on Windows).
+
+    The loop is passed as a loop factory rather than through
+    uvloop.install(), which swaps the global event loop policy and is
+    deprecated from Python 3.12.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
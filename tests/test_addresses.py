@@ -0,0 +1,26 @@
+"""
+Unit tests for address helpers.
+"""
+
+from web3 import Web3
+from utils.addresses import checksum_address
+
+
+class TestChecksumAddress:
+    """Test cached checksum conversion."""
+
+    def test_matches_web3(self):
+        """Test result matches Web3.to_checksum_address."""
+        address = '0x06efdbff2a14a7c8e15944d1f4a48f9f95f663a4'
+
+        assert checksum_address(address) == Web3.to_checksum_address(address)
+
+    def test_is_cached(self):
+        """Test repeated lookups hit the cache."""
+        address = '0x5300000000000000000000000000000000000004'
+        checksum_address(address)
+        hits = checksum_address.cache_info().hits
+
+        checksum_address(address)
+
+        assert checksum_address.cache_info().hits == hits + 1
@@ -0,0 +1,55 @@
+"""
+Unit tests for configuration loading.
+"""
+
+import dataclasses
+import pytest
+from config.config import Config, SCHEMA, _parse_env_text, get_config
+
+
+class TestParseEnvText:
+    """Test the .env parser."""
+
+    def test_simple_values(self):
+        """Test plain KEY=value lines."""
+        values = _parse_env_text("NETWORK_MODE=testnet\nMAX_ROUTING_HOPS=2\n")
+
+        assert values == {'NETWORK_MODE': 'testnet', 'MAX_ROUTING_HOPS': '2'}
+
+    def test_comments_and_blank_lines(self):
+        """Test that comments and blank lines are ignored."""
+        text = "# Header comment\n\nPROFIT_THRESHOLD=0.005  # 0.5%\n#DEBUG_MODE=true\n"
+
+        assert _parse_env_text(text) == {'PROFIT_THRESHOLD': '0.005'}
+
+    def test_quoted_values(self):
+        """Test that quotes are stripped and '#' inside quotes is kept."""
+        text = "A=\"hello # world\"\nB='single'\n"
+
+        assert _parse_env_text(text) == {'A': 'hello # world', 'B': 'single'}
+
+    def test_empty_value_and_export(self):
+        """Test empty values and the optional 'export' prefix."""
+        text = "FLASHLOAN_CONTRACT=\nexport DEBUG_MODE=true\r\n"
+
+        assert _parse_env_text(text) == {'FLASHLOAN_CONTRACT': '', 'DEBUG_MODE': 'true'}
+
+
+class TestConfig:
+    """Test the Config singleton."""
+
+    def test_get_config_is_cached(self):
+        """Test that get_config returns the same instance."""
+        assert get_config() is get_config()
+
+    def test_config_is_frozen(self):
+        """Test that config cannot be mutated."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            get_config().PROFIT_THRESHOLD = 1.0
+
+    def test_schema_fields_present(self):
+        """Test that every schema field plus derived fields exist on Config."""
+        field_names = {f.name for f in dataclasses.fields(Config)}
+
+        assert set(SCHEMA) <= field_names
+        assert {'ACTIVE_RPC', 'ACTIVE_CHAIN_ID'} <= field_names
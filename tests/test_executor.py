@@ -0,0 +1,90 @@
+"""
+Unit tests for the arbitrage executor.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from web3 import Web3
+from src.executor import ArbitrageExecutor, CircuitBreaker, ExecutionError
+
+
+@pytest.fixture
+def mock_w3():
+    """Create a mock Web3 instance."""
+    w3 = Mock(spec=Web3)
+    w3.eth = Mock()
+    w3.eth.contract = Mock()
+    return w3
+
+
+@pytest.fixture
+def executor(mock_w3):
+    """Create an executor whose checks pass and whose sends go through the send lock."""
+    executor = ArbitrageExecutor(
+        mock_w3,
+        contract_address='0x5300000000000000000000000000000000000004',
+        dry_run=True
+    )
+    executor.notifier = Mock()
+    executor.notifier.send_error = AsyncMock()
+    executor._validate_opportunity = Mock()
+    executor._check_slippage = AsyncMock()
+
+    async def simulate(opp):
+        # Yield like the real RPC-bound simulation so evaluations overlap
+        await asyncio.sleep(0)
+        return {'profit_tokens': 0.01, 'profit_usd': 30.0}
+
+    executor._simulate_execution = AsyncMock(side_effect=simulate)
+    # Exercise the live send path without signing anything
+    executor._execute_fn = executor._execute_serialized
+    return executor
+
+
+@pytest.fixture
+def opportunity():
+    """Opportunity as produced by the scanner."""
+    return {
+        'token_in': 'WETH',
+        'token_out': 'USDC',
+        'buy_dex': 'SyncSwap',
+        'sell_dex': 'Zebra',
+        'amount': 1.0,
+        'profit_pct': 1.0,
+        'profit_usd': 30.0
+    }
+
+
+class TestEvaluateAndExecuteMany:
+    """Test batched evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order(self, executor, opportunity):
+        """Test each opportunity gets its own result, in order."""
+        executor._execute_arbitrage = AsyncMock(side_effect=lambda opp, sim: {'status': 'success', 'opp': opp})
+        opportunities = [dict(opportunity, amount=float(i)) for i in range(3)]
+
+        results = await executor.evaluate_and_execute_many(opportunities)
+
+        assert [r['opp'] for r in results] == opportunities
+        assert executor._execute_arbitrage.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_tripped_breaker_stops_queued_sends(self, executor, opportunity):
+        """Test a failed send trips the breaker for sends already queued on the lock."""
+        executor.circuit_breaker = CircuitBreaker(max_failures=1)
+
+        async def failing_send(opp, simulated_profit):
+            executor.circuit_breaker.record_failure("Transaction reverted")
+            raise ExecutionError("Execution failed: Transaction reverted")
+
+        executor._execute_arbitrage = AsyncMock(side_effect=failing_send)
+
+        results = await executor.evaluate_and_execute_many([opportunity] * 3)
+
+        assert results == [None, None, None]
+        # All three passed the entry check; only the first reached the chain
+        assert executor._simulate_execution.await_count == 3
+        assert executor._execute_arbitrage.await_count == 1
+        assert executor.circuit_breaker.is_tripped()
@@ -0,0 +1,71 @@
+"""
+Unit tests for Multicall3 batching.
+"""
+
+import pytest
+from unittest.mock import Mock
+from eth_abi import encode
+from web3 import Web3
+from utils.multicall import Multicall, decode_results, MULTICALL3_ADDRESS
+
+
+@pytest.fixture
+def mock_w3():
+    """Create a mock Web3 instance."""
+    w3 = Mock(spec=Web3)
+    w3.eth = Mock()
+    w3.eth.contract = Mock()
+    return w3
+
+
+class TestMulticall:
+    """Test Multicall wrapper."""
+
+    def test_initialization(self, mock_w3):
+        """Test multicall contract is bound to the Multicall3 address."""
+        Multicall(mock_w3)
+
+        kwargs = mock_w3.eth.contract.call_args.kwargs
+        assert kwargs['address'] == MULTICALL3_ADDRESS
+
+    def test_try_aggregate_empty(self, mock_w3):
+        """Test that an empty batch makes no RPC call."""
+        multicall = Multicall(mock_w3)
+
+        assert multicall.try_aggregate([]) == []
+        mock_w3.eth.contract.return_value.functions.tryAggregate.assert_not_called()
+
+    def test_try_aggregate(self, mock_w3):
+        """Test that calls are sent in one batch without requiring success."""
+        contract = mock_w3.eth.contract.return_value
+        contract.functions.tryAggregate.return_value.call.return_value = [
+            (True, b'\x01'),
+            (False, b'')
+        ]
+        multicall = Multicall(mock_w3)
+
+        calls = [('0x' + '11' * 20, b'\xaa'), ('0x' + '22' * 20, b'\xbb')]
+        results = multicall.try_aggregate(calls)
+
+        contract.functions.tryAggregate.assert_called_once_with(False, calls)
+        assert results == [(True, b'\x01'), (False, b'')]
+
+
+class TestDecodeResults:
+    """Test multicall result decoding."""
+
+    def test_decode_success(self):
+        """Test decoding successful results."""
+        results = [(True, encode(['uint128'], [12345]))]
+
+        assert decode_results(results, ['uint128']) == [(12345,)]
+
+    def test_decode_failure_returns_none(self):
+        """Test failed and empty calls decode to None."""
+        results = [
+            (False, encode(['uint128'], [1])),
+            (True, b''),
+            (True, b'\x00'),  # Too short to decode
+        ]
+
+        assert decode_results(results, ['uint128']) == [None, None, None]
@@ -85,31 +85,31 @@ class TestTelegramNotifier:
     @pytest.mark.asyncio
     async def test_send_message_success(self, telegram_notifier):
         """Test successful message sending."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.__aenter__.return_value = mock_response
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.__aenter__.return_value = mock_response
 
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_session.return_value.__aenter__.return_value.post = mock_post
+        mock_session = Mock()
+        mock_session.post = Mock(return_value=mock_response)
 
+        with patch.object(telegram_notifier, '_get_session', AsyncMock(return_value=mock_session)):
             result = await telegram_notifier.send_message("Test message")
 
             assert result is True
-            mock_post.assert_called_once()
+            mock_session.post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_message_api_error(self, telegram_notifier):
         """Test message sending with API error."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 400
-            mock_response.text = AsyncMock(return_value='Bad Request')
-            mock_response.__aenter__.return_value = mock_response
+        mock_response = AsyncMock()
+        mock_response.status = 400
+        mock_response.text = AsyncMock(return_value='Bad Request')
+        mock_response.__aenter__.return_value = mock_response
 
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_session.return_value.__aenter__.return_value.post = mock_post
+        mock_session = Mock()
+        mock_session.post = Mock(return_value=mock_response)
 
+        with patch.object(telegram_notifier, '_get_session', AsyncMock(return_value=mock_session)):
             result = await telegram_notifier.send_message("Test message")
 
             assert result is False
@@ -117,13 +117,43 @@ class TestTelegramNotifier:
     @pytest.mark.asyncio
     async def test_send_message_timeout(self, telegram_notifier):
         """Test message sending with timeout."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_session.return_value.__aenter__.return_value.post.side_effect = asyncio.TimeoutError()
+        mock_session = Mock()
+        mock_session.post = Mock(side_effect=asyncio.TimeoutError())
 
+        with patch.object(telegram_notifier, '_get_session', AsyncMock(return_value=mock_session)):
             result = await telegram_notifier.send_message("Test message")
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_session_reused_across_messages(self, telegram_notifier):
+        """Test that one HTTP session serves every message until closed."""
+        with patch('utils.notifications.aiohttp.ClientSession') as mock_client_session:
+            mock_client_session.return_value.closed = False
+            mock_client_session.return_value.close = AsyncMock()
+            with patch('utils.notifications.aiohttp.TCPConnector'):
+                first = await telegram_notifier._get_session()
+                second = await telegram_notifier._get_session()
+
+                assert first is second
+                mock_client_session.assert_called_once()
+
+                await telegram_notifier.close()
+
+                first.close.assert_awaited_once()
+                assert telegram_notifier._session is None
+
+    def test_new_session_on_new_event_loop(self, telegram_notifier):
+        """Test that a session from a finished event loop is not reused."""
+        with patch('utils.notifications.aiohttp.ClientSession') as mock_client_session:
+            mock_client_session.side_effect = lambda **kwargs: Mock(closed=False)
+            with patch('utils.notifications.aiohttp.TCPConnector'):
+                first = asyncio.run(telegram_notifier._get_session())
+                second = asyncio.run(telegram_notifier._get_session())
+
+                assert first is not second
+                assert mock_client_session.call_count == 2
+
     @pytest.mark.asyncio
     async def test_send_opportunity_alert(self, telegram_notifier, sample_opportunity):
         """Test sending opportunity alert."""
@@ -214,34 +244,35 @@ class TestDiscordNotifier:
     @pytest.mark.asyncio
     async def test_send_message_success(self, discord_notifier):
         """Test successful message sending."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.__aenter__.return_value = mock_response
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.__aenter__.return_value = mock_response
 
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_session.return_value.__aenter__.return_value.post = mock_post
+        mock_session = Mock()
+        mock_session.post = Mock(return_value=mock_response)
 
+        with patch.object(discord_notifier, '_get_session', AsyncMock(return_value=mock_session)):
             result = await discord_notifier.send_message("Test message")
 
             assert result is True
-            mock_post.assert_called_once()
+            mock_session.post.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_send_message_with_embeds(self, discord_notifier):
         """Test message sending with embeds."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.__aenter__.return_value = mock_response
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.__aenter__.return_value = mock_response
 
-            mock_post = AsyncMock(return_value=mock_response)
-            mock_session.return_value.__aenter__.return_value.post = mock_post
+        mock_session = Mock()
+        mock_session.post = Mock(return_value=mock_response)
 
+        with patch.object(discord_notifier, '_get_session', AsyncMock(return_value=mock_session)):
             embeds = [{'title': 'Test', 'description': 'Test embed'}]
             result = await discord_notifier.send_message("", embeds=embeds)
 
             assert result is True
+            assert mock_session.post.call_args.kwargs['json']['embeds'] == embeds
 
     @pytest.mark.asyncio
     async def test_send_opportunity_alert(self, discord_notifier, sample_opportunity):
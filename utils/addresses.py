@@ -0,0 +1,24 @@
+"""
+Address helpers shared across modules.
+
+EIP-55 checksumming hashes the address with keccak256 on every call. The set
+of addresses the bot touches (tokens, routers, factories, pairs) is small and
+fixed, so results are memoized process-wide.
+"""
+
+from functools import lru_cache
+from web3 import Web3
+
+
+@lru_cache(maxsize=4096)
+def checksum_address(address: str) -> str:
+    """
+    Return the EIP-55 checksum form of an address, cached.
+
+    Args:
+        address: Hex address in any case
+
+    Returns:
+        Checksummed address
+    """
+    return Web3.to_checksum_address(address)
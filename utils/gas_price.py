@@ -10,8 +10,9 @@ Fixes implemented:
 """
 
 from web3 import Web3
+from web3.contract import Contract
 from web3.exceptions import Web3Exception
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 import time
 import json
@@ -19,6 +20,7 @@ from pathlib import Path
 
 # Import logging
 from config.logging_config import get_logger
+from utils.addresses import checksum_address
 
 logger = get_logger(__name__)
 
@@ -62,7 +64,7 @@ class GasPriceFetcher:
         Raises:
             RuntimeError: If RPC consistently fails and cache is stale
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Check cache
         if self._cache and current_time - self._cache.timestamp < self._cache_duration:
@@ -201,33 +203,27 @@ class ETHPriceFetcher:
 
         # Get token addresses
         tokens = {t['symbol']: t for t in data['scroll']['common_tokens']}
-        self.weth_address = Web3.to_checksum_address(tokens['WETH']['address'])
-        self.usdc_address = Web3.to_checksum_address(tokens['USDC']['address'])
+        self.weth_address = checksum_address(tokens['WETH']['address'])
+        self.usdc_address = checksum_address(tokens['USDC']['address'])
         self.usdc_decimals = tokens['USDC']['decimals']
 
         # Get SyncSwap factory (most liquid DEX on Scroll)
         dexes = {d['name']: d for d in data['scroll']['dexes']}
-        self.syncswap_factory = Web3.to_checksum_address(dexes['SyncSwap']['factory'])
+        self.syncswap_factory = checksum_address(dexes['SyncSwap']['factory'])
+
+        # WETH/USDC pair contract and token order, resolved on first use
+        self._pair: Optional[Tuple[Contract, bool]] = None
 
         logger.info(f"ETH price fetcher initialized: WETH={self.weth_address}, USDC={self.usdc_address}")
 
-    def get_eth_price_usd(self) -> float:
+    def _get_pair(self) -> Tuple[Contract, bool]:
         """
-        Get current ETH price in USD from DEX pool.
-
-        Queries WETH/USDC pool on SyncSwap for real-time price.
+        Resolve the WETH/USDC pair once; its address and token order never change.
 
         Returns:
-            ETH price in USD
+            (pair contract, whether WETH is token0)
         """
-        current_time = time.time()
-
-        # Check cache
-        if self._cache and current_time - self._cache.timestamp < self._cache_duration:
-            return self._cache.value
-
-        try:
-            # Get WETH/USDC pair address
+        if self._pair is None:
             factory = self.w3.eth.contract(
                 address=self.syncswap_factory,
                 abi=self.FACTORY_ABI
@@ -238,15 +234,32 @@ class ETHPriceFetcher:
             if pair_address == '0x0000000000000000000000000000000000000000':
                 raise ValueError("WETH/USDC pair not found on SyncSwap")
 
-            pair_address = Web3.to_checksum_address(pair_address)
+            pair_address = checksum_address(pair_address)
             logger.debug(f"WETH/USDC pair address: {pair_address}")
 
-            # Get pair contract
             pair = self.w3.eth.contract(address=pair_address, abi=self.PAIR_ABI)
-
-            # Get token order
             token0 = pair.functions.token0().call()
-            token1 = pair.functions.token1().call()
+            self._pair = (pair, token0.lower() == self.weth_address.lower())
+
+        return self._pair
+
+    def get_eth_price_usd(self) -> float:
+        """
+        Get current ETH price in USD from DEX pool.
+
+        Queries WETH/USDC pool on SyncSwap for real-time price.
+
+        Returns:
+            ETH price in USD
+        """
+        current_time = time.monotonic()
+
+        # Check cache
+        if self._cache and current_time - self._cache.timestamp < self._cache_duration:
+            return self._cache.value
+
+        try:
+            pair, weth_is_token0 = self._get_pair()
 
             # Get reserves
             reserves = pair.functions.getReserves().call()
@@ -256,7 +269,7 @@ class ETHPriceFetcher:
             logger.debug(f"Reserves: token0={reserve0}, token1={reserve1}")
 
             # Calculate price based on token order
-            if token0.lower() == self.weth_address.lower():
+            if weth_is_token0:
                 # token0 is WETH, token1 is USDC
                 weth_reserve = reserve0 / 1e18
                 usdc_reserve = reserve1 / (10 ** self.usdc_decimals)
@@ -0,0 +1,122 @@
+"""
+Multicall3 batching for read-only contract calls.
+
+Packs many eth_call requests into a single Multicall3.tryAggregate call so
+N quotes cost one RPC round trip instead of N.
+
+Multicall3 is deployed at the same address on Scroll mainnet and Sepolia:
+https://www.multicall3.com/deployments
+"""
+
+from eth_abi import decode
+from web3 import Web3
+from typing import List, Optional, Sequence, Tuple
+import json
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'  # Already checksummed
+
+# Multicall3 ABI (minimal - tryAggregate only)
+MULTICALL3_ABI = json.loads('''[
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]''')
+
+
+class Multicall:
+    """
+    Thin wrapper around Multicall3.tryAggregate.
+
+    Individual call failures are reported per call (success=False) rather
+    than reverting the whole batch.
+    """
+
+    def __init__(self, w3: Web3, address: str = MULTICALL3_ADDRESS):
+        """
+        Initialize multicall helper.
+
+        Args:
+            w3: Web3 instance
+            address: Multicall3 contract address
+        """
+        self.w3 = w3
+        self.contract = w3.eth.contract(
+            address=Web3.to_checksum_address(address),
+            abi=MULTICALL3_ABI
+        )
+
+    def try_aggregate(
+        self,
+        calls: Sequence[Tuple[str, bytes]]
+    ) -> List[Tuple[bool, bytes]]:
+        """
+        Execute a batch of calls in one eth_call.
+
+        Args:
+            calls: Sequence of (target address, calldata) tuples
+
+        Returns:
+            List of (success, return_data) tuples, in the same order as calls
+        """
+        if not calls:
+            return []
+
+        results = self.contract.functions.tryAggregate(False, list(calls)).call()
+        logger.debug(f"Multicall3 batch of {len(calls)} calls completed")
+        return [(success, bytes(data)) for success, data in results]
+
+
+def decode_results(
+    results: Sequence[Tuple[bool, bytes]],
+    types: List[str]
+) -> List[Optional[tuple]]:
+    """
+    ABI-decode a batch of multicall results.
+
+    Args:
+        results: (success, return_data) tuples from try_aggregate
+        types: ABI output types of the called function (e.g. ['uint128'])
+
+    Returns:
+        Decoded tuples, with None for failed or undecodable calls
+    """
+    decoded = []
+    for success, data in results:
+        if not success or not data:
+            decoded.append(None)
+            continue
+        try:
+            decoded.append(tuple(decode(types, data)))
+        except Exception as e:
+            logger.debug(f"Failed to decode multicall result: {e}")
+            decoded.append(None)
+    return decoded
@@ -19,6 +19,18 @@ from utils.rate_limiter import RateLimiter
 logger = get_logger(__name__)
 
 
+def _new_session() -> aiohttp.ClientSession:
+    """
+    HTTP session for a notifier, kept open across messages.
+
+    Reusing one session keeps the TCP/TLS connection to the API alive, so
+    only the first alert of a burst pays for the handshake.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+    )
+
+
 class TelegramNotifier:
     """
     Telegram bot notification system.
@@ -42,6 +54,10 @@ class TelegramNotifier:
         # Rate limiter: Telegram allows 30 messages/second, we'll be conservative with 20/sec
         self.rate_limiter = RateLimiter(max_calls=20, period=1.0, name="TelegramRateLimit")
 
+        # Created on first send, inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
         if self.enabled:
             # Mask sensitive data in logs
             masked_token = f"{bot_token[:10]}...{bot_token[-4:]}" if len(bot_token) > 14 else "***"
@@ -50,6 +66,28 @@ class TelegramNotifier:
         else:
             logger.warning("Telegram notifier disabled (missing bot_token or chat_id)")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, opening it if needed.
+
+        A session is bound to the event loop it was created on; if the
+        notifier is used from a new loop (e.g. a later asyncio.run), the old
+        session is abandoned and a fresh one opened.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = _new_session()
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            self._session = None
+            self._session_loop = None
+
     async def send_message(
         self,
         message: str,
@@ -75,23 +113,23 @@ class TelegramNotifier:
         await self.rate_limiter.acquire()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.api_url}/sendMessage"
-                payload = {
-                    "chat_id": self.chat_id,
-                    "text": message,
-                    "parse_mode": parse_mode,
-                    "disable_web_page_preview": disable_preview
-                }
-
-                async with session.post(url, json=payload, timeout=10) as response:
-                    if response.status == 200:
-                        logger.debug("Telegram message sent successfully")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Telegram API error {response.status}: {error_text}")
-                        return False
+            session = await self._get_session()
+            url = f"{self.api_url}/sendMessage"
+            payload = {
+                "chat_id": self.chat_id,
+                "text": message,
+                "parse_mode": parse_mode,
+                "disable_web_page_preview": disable_preview
+            }
+
+            async with session.post(url, json=payload, timeout=10) as response:
+                if response.status == 200:
+                    logger.debug("Telegram message sent successfully")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Telegram API error {response.status}: {error_text}")
+                    return False
 
         except asyncio.TimeoutError:
             logger.error("Telegram message timeout")
@@ -251,6 +289,10 @@ class DiscordNotifier:
         # Rate limiter: Discord webhooks allow 30 requests/minute, we'll use 25/min to be safe
         self.rate_limiter = RateLimiter(max_calls=25, period=60.0, name="DiscordRateLimit")
 
+        # Created on first send, inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
         if self.enabled:
             # Mask webhook URL in logs
             if webhook_url:
@@ -261,6 +303,28 @@ class DiscordNotifier:
         else:
             logger.warning("Discord notifier disabled (missing webhook_url)")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, opening it if needed.
+
+        A session is bound to the event loop it was created on; if the
+        notifier is used from a new loop (e.g. a later asyncio.run), the old
+        session is abandoned and a fresh one opened.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = _new_session()
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            if self._session_loop is asyncio.get_running_loop():
+                await self._session.close()
+            self._session = None
+            self._session_loop = None
+
     async def send_message(
         self,
         content: str,
@@ -284,23 +348,23 @@ class DiscordNotifier:
         await self.rate_limiter.acquire()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                payload = {"content": content}
-                if embeds:
-                    payload["embeds"] = embeds
-
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=10
-                ) as response:
-                    if response.status in [200, 204]:
-                        logger.debug("Discord message sent successfully")
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Discord webhook error {response.status}: {error_text}")
-                        return False
+            session = await self._get_session()
+            payload = {"content": content}
+            if embeds:
+                payload["embeds"] = embeds
+
+            async with session.post(
+                self.webhook_url,
+                json=payload,
+                timeout=10
+            ) as response:
+                if response.status in [200, 204]:
+                    logger.debug("Discord message sent successfully")
+                    return True
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Discord webhook error {response.status}: {error_text}")
+                    return False
 
         except asyncio.TimeoutError:
             logger.error("Discord message timeout")
@@ -391,6 +455,12 @@ class NotificationManager:
             f"Discord: {self.discord is not None})"
         )
 
+    async def close(self) -> None:
+        """Close the HTTP sessions of all enabled platforms."""
+        for notifier in (self.telegram, self.discord):
+            if notifier:
+                await notifier.close()
+
     async def send_opportunity(self, opportunity: Dict) -> None:
         """
         Send opportunity alert to all enabled platforms.
@@ -8,6 +8,7 @@ This module calculates expected slippage for trades based on:
 """
 
 from web3 import Web3
+from web3.contract import Contract
 from typing import Dict, Optional, Tuple
 import json
 from pathlib import Path
@@ -15,6 +16,7 @@ from decimal import Decimal, getcontext
 import math
 
 from config.logging_config import get_logger
+from utils.addresses import checksum_address
 
 logger = get_logger(__name__)
 
@@ -103,8 +105,53 @@ class SlippageCalculator:
         self.dexes = {d['name']: d for d in data['scroll']['dexes']}
         self.tokens = {t['symbol']: t for t in data['scroll']['common_tokens']}
 
+        # (dex name, token_in, token_out) -> (pair contract, pair address, token0 address).
+        # Pair addresses and token order never change once a pool exists, so
+        # only getReserves is called on repeat lookups.
+        self._pairs: Dict[Tuple[str, str, str], Tuple[Contract, str, str]] = {}
+
         logger.info("Slippage calculator initialized")
 
+    def _get_pair(
+        self,
+        dex: Dict,
+        token_in_addr: str,
+        token_out_addr: str
+    ) -> Optional[Tuple[Contract, str, str]]:
+        """
+        Look up a V2 pair contract, its address and its token0, cached per DEX and token pair.
+
+        Args:
+            dex: DEX configuration dict
+            token_in_addr: Checksummed input token address
+            token_out_addr: Checksummed output token address
+
+        Returns:
+            (pair contract, checksummed pair address, lowercase token0 address),
+            or None if no pair exists
+        """
+        key = (dex['name'], token_in_addr, token_out_addr)
+        cached = self._pairs.get(key)
+        if cached is not None:
+            return cached
+
+        factory = self.w3.eth.contract(
+            address=checksum_address(dex['factory']),
+            abi=self.FACTORY_ABI
+        )
+        pair_address = factory.functions.getPair(token_in_addr, token_out_addr).call()
+
+        # Missing pairs are not cached; the pool may be created later
+        if pair_address == '0x0000000000000000000000000000000000000000':
+            return None
+
+        pair_address = checksum_address(pair_address)
+        pair = self.w3.eth.contract(address=pair_address, abi=self.PAIR_ABI)
+        token0 = pair.functions.token0().call().lower()
+
+        self._pairs[key] = (pair, pair_address, token0)
+        return pair, pair_address, token0
+
     def calculate_v2_slippage(
         self,
         dex_name: str,
@@ -131,29 +178,14 @@ class SlippageCalculator:
         try:
             dex = self.dexes[dex_name]
 
-            # Get pair address
-            factory = self.w3.eth.contract(
-                address=Web3.to_checksum_address(dex['factory']),
-                abi=self.FACTORY_ABI
-            )
-
-            token_in_addr = Web3.to_checksum_address(token_in['address'])
-            token_out_addr = Web3.to_checksum_address(token_out['address'])
+            token_in_addr = checksum_address(token_in['address'])
+            token_out_addr = checksum_address(token_out['address'])
 
-            pair_address = factory.functions.getPair(token_in_addr, token_out_addr).call()
-
-            if pair_address == '0x0000000000000000000000000000000000000000':
+            pair_info = self._get_pair(dex, token_in_addr, token_out_addr)
+            if pair_info is None:
                 logger.debug(f"Pair not found: {token_in['symbol']}/{token_out['symbol']} on {dex_name}")
                 return None
-
-            pair_address = Web3.to_checksum_address(pair_address)
-
-            # Get pair contract
-            pair = self.w3.eth.contract(address=pair_address, abi=self.PAIR_ABI)
-
-            # Get token order
-            token0 = pair.functions.token0().call()
-            token1 = pair.functions.token1().call()
+            pair, pair_address, token0 = pair_info
 
             # Get reserves
             reserves = pair.functions.getReserves().call()
@@ -161,7 +193,7 @@ class SlippageCalculator:
             reserve1 = reserves[1]
 
             # Determine which reserve is which token
-            if token0.lower() == token_in_addr.lower():
+            if token0 == token_in_addr.lower():
                 reserve_in = reserve0
                 reserve_out = reserve1
                 decimals_in = token_in['decimals']